@@ -3,8 +3,7 @@
 
 #start_imports
 import os
-import math
-import itertools
+import numpy
 from matplotlib import pyplot as plt
 from matplotlib.patches import Circle
 from random import Random
@@ -23,102 +22,151 @@ moon_mass = 7.36e22
 moon_radius = 1.737e6
 moon_position = (384403e3, 0)
 earth_position = (0, 0)
+GM_earth = G * earth_mass # Standard gravitational parameters
+GM_moon = G * moon_mass
 #end_globals
 
-def pairwise(iterable):
-    """s -> (s0,s1), (s1,s2), (s2, s3), ..."""
-    a, b = itertools.tee(iterable)
-    next(b, None)
-    return zip(a, b)
-    
 def distance_between(position_a, position_b):
-    return math.sqrt((position_a[0] - position_b[0])**2 + (position_a[1] - position_b[1])**2)
+    return numpy.hypot(position_a[0] - position_b[0], position_a[1] - position_b[1])
     
-def gravitational_force(position_a, mass_a, position_b, mass_b):
-    """Returns the gravitational force between the two bodies a and b."""
-    distance = distance_between(position_a, position_b)
-
-    # Calculate the direction and magnitude of the force.
-    angle = math.atan2(position_a[1] - position_b[1], position_a[0] - position_b[0])
-    magnitude = G * mass_a * mass_b / (distance**2)
-
-    # Find the x and y components of the force.
-    # Determine sign based on which one is the larger body.
-    sign = -1 if mass_b > mass_a else 1
-    x_force = sign * magnitude * math.cos(angle)
-    y_force = sign * magnitude * math.sin(angle)
-    return x_force, y_force
-
-def force_on_satellite(position, mass):
-    """Returns the total gravitational force acting on the body from the Earth and Moon."""
-    earth_grav_force = gravitational_force(position, mass, earth_position, earth_mass)
-    moon_grav_force = gravitational_force(position, mass, moon_position, moon_mass)
-    F_x = earth_grav_force[0] + moon_grav_force[0]
-    F_y = earth_grav_force[1] + moon_grav_force[1]
-    return F_x, F_y
-
-def acceleration_of_satellite(position, mass):
-    """Returns the acceleration based on all forces acting upon the body."""
-    F_x, F_y = force_on_satellite(position, mass)
-    return F_x / mass, F_y / mass
+def gravitational_acceleration(position_a, position_b, GM_b):
+    """Returns the acceleration of body a due to the gravity of body b."""
+    # The pull points from a toward b, and its components are found
+    # from the separation directly instead of through the angle.
+    dx = position_a[0] - position_b[0]
+    dy = position_a[1] - position_b[1]
+    distance_squared = dx * dx + dy * dy
+    k = GM_b / (distance_squared * numpy.sqrt(distance_squared))
+    return -k * dx, -k * dy
+
+# The Earth and the Moon are stacked into columns so that their pulls on
+# every satellite can be found with a single call to gravitational_acceleration.
+bodies_position = (numpy.array([[earth_position[0]], [moon_position[0]]]), 
+                   numpy.array([[earth_position[1]], [moon_position[1]]]))
+bodies_GM = numpy.array([[GM_earth], [GM_moon]])
+
+def acceleration_of_satellite(position):
+    """Returns the acceleration of the body due to the Earth and Moon."""
+    # The mass of the body cancels out of Newton's law of gravitation,
+    # so the acceleration does not depend on it.
+    a_x, a_y = gravitational_acceleration(position, bodies_position, bodies_GM)
+    return a_x.sum(axis=0), a_y.sum(axis=0)
+
+# Coefficients of the Cash-Karp embedded Runge-Kutta method.
+#start_cash_karp
+cash_karp_a = ((),
+               (1/5,),
+               (3/40, 9/40),
+               (3/10, -9/10, 6/5),
+               (-11/54, 5/2, -70/27, 35/27),
+               (1631/55296, 175/512, 575/13824, 44275/110592, 253/4096))
+cash_karp_b5 = (37/378, 0, 250/621, 125/594, 0, 512/1771)
+cash_karp_b4 = (2825/27648, 0, 18575/48384, 13525/55296, 277/14336, 1/4)
+cash_karp_stage_weights = numpy.array([a + (0,) * (len(cash_karp_a) - len(a)) for a in cash_karp_a])
+cash_karp_step_weights = numpy.array([cash_karp_b5, numpy.subtract(cash_karp_b5, cash_karp_b4)])
+#end_cash_karp
+
+def satellite_derivatives(state):
+    """Returns the rate of change of the state (x, y, x velocity, y velocity) of the body."""
+    x, y, vx, vy = state
+    ax, ay = acceleration_of_satellite((x, y))
+    return numpy.array([vx, vy, ax, ay])
+
+def rk45_step(state, time_step):
+    """Returns the state after one Cash-Karp step along with its error estimate."""
+    # The stages are kept in one array so that each weighted sum of them
+    # is a single matrix product over all of the satellites at once.
+    shape = state.shape
+    k = numpy.zeros((len(cash_karp_a),) + shape)
+    stages = k.reshape(len(cash_karp_a), -1)
+    for i, a in enumerate(cash_karp_stage_weights):
+        k[i] = satellite_derivatives(state + time_step * (a @ stages).reshape(shape))
+    new_state, error = (cash_karp_step_weights @ stages).reshape((2,) + shape)
+    return state + time_step * new_state, time_step * error
 
 def moonshot(orbital_height, satellite_mass, boost_velocity, initial_y_velocity, 
-             time_step=60, max_iterations=5e4, plot_trajectory=False):
-    fitness = 0.0
-    distance_from_earth_center = orbital_height + earth_radius
-    eqb_velocity = math.sqrt(G * earth_mass / distance_from_earth_center)
+             time_step=60, max_iterations=5e4, tolerance=1e-6, record_trajectory=False):
+    # Every argument may be an array with one entry per satellite, in which
+    # case all of the satellites are flown together and each entry of the
+    # state below is an array holding the values for every satellite.
+    # The satellite mass is one of the evolved parameters, but it cancels
+    # out of the equations of motion, so it does not change the trajectory.
+    orbital_height, satellite_mass, boost_x, boost_y, initial_y_velocity = numpy.broadcast_arrays(
+        *[numpy.atleast_1d(numpy.asarray(v, dtype=numpy.float64)) 
+          for v in (orbital_height, satellite_mass, boost_velocity[0], boost_velocity[1], initial_y_velocity)])
+    num_satellites = len(orbital_height)
+    fitness = numpy.zeros(num_satellites)
     
     # Start the simulation.
-    # Keep up with the positions of the satellite as it moves.
-    position = [(earth_radius + orbital_height, 0.0)] # The initial position of the satellite.
-    velocity = [0.0, initial_y_velocity]
-    time = 0
-    min_distance_from_moon = distance_between(position[-1], moon_position) - moon_radius
-
-    i = 0 
-    keep_simulating = True
-    rockets_boosted = False
-
-    while keep_simulating:
-        # Calculate the acceleration and corresponding change in velocity.
-        # (This is effectively the Forward Euler Algorithm.)
-        acceleration = acceleration_of_satellite(position[-1], satellite_mass)
-        velocity[0] += acceleration[0] * time_step
-        velocity[1] += acceleration[1] * time_step 
+    # The positions of the first satellite are only kept if they are asked
+    # for. They go into an array that doubles in size whenever it fills up.
+    state = numpy.array([earth_radius + orbital_height, numpy.zeros(num_satellites), 
+                         numpy.zeros(num_satellites), initial_y_velocity])
+    if record_trajectory:
+        trajectory = numpy.empty((1024, 2))
+        trajectory[0] = state[:2, 0] # The initial position of the satellite.
+        num_positions = 1
+    time = numpy.zeros(num_satellites)
+    max_time = max_iterations * time_step
+    time_step = numpy.full(num_satellites, float(time_step))
+    min_distance_from_moon = distance_between(state, moon_position) - moon_radius
+    total_distance = numpy.zeros(num_satellites)
+
+    max_distance_from_earth = 2 * distance_between(earth_position, moon_position)
+
+    active = numpy.ones(num_satellites, dtype=bool)
+    rockets_boosted = numpy.zeros(num_satellites, dtype=bool)
+
+    while active.any():
+        # Calculate the new states using an adaptive Runge-Kutta step.
+        # A step is retried with a smaller time step if its estimated
+        # error is too large, and the next one grows if it is small.
+        new_state, error = rk45_step(state, time_step)
+        scaled_error = numpy.max(abs(error) / (abs(state) + abs(new_state - state) + 1e-30), axis=0) / tolerance
+        scaled_error = numpy.maximum(scaled_error, 1e-30)
+        accepted = active & (scaled_error <= 1)
+        time_step = numpy.where(active & ~accepted, 
+                                time_step * numpy.maximum(0.1, 0.9 * scaled_error**-0.25), time_step)
 
         # Start the rocket burn:
         # add a boost in the +x direction of 1m/s
         # closest point to the moon
-        if position[-1][1] < -100 and position[-1][0] > distance_from_earth_center-100 and not rockets_boosted: 
-            launch_point = position[-1]
-            velocity[0] += boost_velocity[0]
-            velocity[1] += boost_velocity[1]
-            rockets_boosted = True
-
-        # Calculate the new position based on the velocity.
-        position.append((position[-1][0] + velocity[0] * time_step, 
-                         position[-1][1] + velocity[1] * time_step))
-        time += time_step
-
-        if i >= max_iterations:
-            keep_simulating = False
-
-        distance_from_moon_surface = distance_between(position[-1], moon_position) - moon_radius
-        distance_from_earth_surface = distance_between(position[-1], earth_position) - earth_radius
-        if distance_from_moon_surface < min_distance_from_moon:
-            min_distance_from_moon = distance_from_moon_surface
+        # This happens the first time a satellite comes back up through
+        # y = -100 on the Moon's side of the Earth, so the step that 
+        # crosses that line is redone to end on it.
+        y, new_y = state[1], new_state[1]
+        burn = accepted & ~rockets_boosted & (y < -100) & (new_y >= -100) & (new_state[0] > 0)
+        if burn.any():
+            time_step[burn] *= (-100 - y[burn]) / (new_y[burn] - y[burn])
+            new_state[:, burn], _ = rk45_step(state[:, burn], time_step[burn])
+            new_state[2][burn] += boost_x[burn]
+            new_state[3][burn] += boost_y[burn]
+            rockets_boosted |= burn
+        step_taken = time_step[accepted]
+        time[accepted] += step_taken
+        time_step[accepted] = step_taken * numpy.minimum(5, 0.9 * scaled_error[accepted]**-0.2)
+        total_distance[accepted] += distance_between(new_state, state)[accepted]
+        state = numpy.where(accepted, new_state, state)
+
+        if record_trajectory and accepted[0]:
+            if num_positions == len(trajectory):
+                trajectory = numpy.concatenate([trajectory, numpy.empty_like(trajectory)])
+            trajectory[num_positions] = state[:2, 0]
+            num_positions += 1
+
+        distance_from_moon_surface = distance_between(state, moon_position) - moon_radius
+        distance_from_earth_surface = distance_between(state, earth_position) - earth_radius
+        min_distance_from_moon = numpy.where(accepted, numpy.minimum(min_distance_from_moon, distance_from_moon_surface), 
+                                             min_distance_from_moon)
             
-        # See if the satellite crashes into the Moon or the Earth, or
-        # if the satellite gets too far away (radio contact is lost).
-        if distance_from_moon_surface <= 0:
-            fitness += 100000 # penalty of 100,000 km if crash on moon
-            keep_simulating = False
-        elif distance_from_earth_surface <= 0:
-            keep_simulating = False
-            fitness -= 100000 # reward of 100,000 km if land on earth
-        elif distance_from_earth_surface > 2 * distance_between(earth_position, moon_position): 
-            keep_simulating = False #radio contact lost
-        i += 1
+        # See if a satellite crashes into the Moon or the Earth, or
+        # if it gets too far away (radio contact is lost).
+        crashed = accepted & (distance_from_moon_surface <= 0)
+        landed = accepted & ~crashed & (distance_from_earth_surface <= 0)
+        lost = distance_from_earth_surface > max_distance_from_earth
+        fitness[crashed] += 100000 # penalty of 100,000 km if crash on moon
+        fitness[landed] -= 100000 # reward of 100,000 km if land on earth
+        active &= ~(crashed | landed | (accepted & lost) | (time >= max_time))
 
     # Augment the fitness to include the minimum distance (in km) 
     # that the satellite made it to the Moon (lower without crashing is better).
@@ -127,57 +175,60 @@ def moonshot(orbital_height, satellite_mass, boost_velocity, initial_y_velocity,
     # Augment the fitness to include 1% of the total distance
     # traveled by the probe (in km). This means the probe
     # should prefer shorter paths.
-    total_distance = 0
-    for p, q in pairwise(position):
-        total_distance += distance_between(p, q)
     fitness += total_distance / 1000.0 * 0.01
 
-    if plot_trajectory:
-        axes = plt.gca()
-        earth = Circle(earth_position, earth_radius, facecolor='b', alpha=1)
-        moon = Circle(moon_position, moon_radius, facecolor='0.5', alpha=1)
-        axes.add_artist(earth)
-        axes.add_artist(moon)
-        axes.annotate('Earth', xy=earth_position,  xycoords='data',
-                      xytext=(0, 1e2), textcoords='offset points',
-                      arrowprops=dict(arrowstyle="->"))
-        axes.annotate('Moon', xy=moon_position,  xycoords='data',
-                      xytext=(0, 1e2), textcoords='offset points',
-                      arrowprops=dict(arrowstyle="->"))
-        x = [p[0] for p in position] 
-        y = [p[1] for p in position]
-        cm = plt.get_cmap('gist_rainbow')
-        lines = plt.scatter(x, y, c=list(range(len(x))), cmap=cm, marker='o', s=2)
-        plt.setp(lines, edgecolors='None')  
-        plt.axis("equal")
-        plt.grid("on")
-        projdir = os.path.dirname(os.getcwd())
-        name = '{0}/{1}.pdf'.format(projdir, str(fitness))
-        plt.savefig(name, format="pdf")
-        plt.clf()
-        
+    if record_trajectory:
+        return fitness, trajectory[:num_positions]
     return fitness
 
 
+def plot_trajectory(trajectory, fitness):
+    """Plots the trajectory of a satellite and saves it to a PDF named by its fitness."""
+    axes = plt.gca()
+    earth = Circle(earth_position, earth_radius, facecolor='b', alpha=1)
+    moon = Circle(moon_position, moon_radius, facecolor='0.5', alpha=1)
+    axes.add_artist(earth)
+    axes.add_artist(moon)
+    axes.annotate('Earth', xy=earth_position,  xycoords='data',
+                  xytext=(0, 1e2), textcoords='offset points',
+                  arrowprops=dict(arrowstyle="->"))
+    axes.annotate('Moon', xy=moon_position,  xycoords='data',
+                  xytext=(0, 1e2), textcoords='offset points',
+                  arrowprops=dict(arrowstyle="->"))
+    x = trajectory[:, 0]
+    y = trajectory[:, 1]
+    cm = plt.get_cmap('gist_rainbow')
+    lines = plt.scatter(x, y, c=list(range(len(x))), cmap=cm, marker='o', s=2)
+    plt.setp(lines, edgecolors='None')  
+    plt.axis("equal")
+    plt.grid("on")
+    projdir = os.path.dirname(os.getcwd())
+    name = '{0}/{1}.pdf'.format(projdir, str(fitness))
+    plt.savefig(name, format="pdf")
+    plt.clf()
+
+
 def satellite_generator(random, args):
-    chromosome = []
-    bounder = args["_ec"].bounder
+    # The bounds are looked up a single time, and each chromosome is drawn
+    # at once from a NumPy generator.
+    if '_satellite_bounds' not in args:
+        bounder = args["_ec"].bounder
+        args['_satellite_bounds'] = (numpy.asarray(bounder.lower_bound, dtype=numpy.float64), 
+                                     numpy.asarray(bounder.upper_bound, dtype=numpy.float64))
     # The constraints are as follows:
     #             orbital   satellite   boost velocity      initial y
     #             height    mass        (x,       y)        velocity
-    for lo, hi in zip(bounder.lower_bound, bounder.upper_bound):
-        chromosome.append(random.uniform(lo, hi))
-    return chromosome
+    lo, hi = args['_satellite_bounds']
+    return inspyred.ec.utilities.numpy_random(random, args).uniform(lo, hi).tolist()
 
 def moonshot_evaluator(candidates, args):
-    fitness=[]
-    for chromosome in candidates:
-        orbital_height = chromosome[0]
-        satellite_mass = chromosome[1]
-        boost_velocity = (chromosome[2], chromosome[3])
-        initial_y_velocity = chromosome[4]
-        fitness.append(moonshot(orbital_height, satellite_mass, boost_velocity, initial_y_velocity))
-    return fitness
+    # All of the satellites in the population are flown at the same time.
+    chromosomes = numpy.asarray(candidates, dtype=numpy.float64).reshape(len(candidates), 5)
+    orbital_height = chromosomes[:, 0]
+    satellite_mass = chromosomes[:, 1]
+    boost_velocity = (chromosomes[:, 2], chromosomes[:, 3])
+    initial_y_velocity = chromosomes[:, 4]
+    return moonshot(orbital_height, satellite_mass, boost_velocity, initial_y_velocity).tolist()
     
 def custom_observer(population, num_generations, num_evaluations, args):
     best = max(population)
@@ -227,5 +278,7 @@ best = final_pop[0]
 components = best.candidate
 print('\nFittest individual:')
 print(best)
-moonshot(components[0], components[1], (components[2], components[3]), components[4], plot_trajectory=True)
+fitness, trajectory = moonshot(components[0], components[1], (components[2], components[3]), components[4], 
+                               record_trajectory=True)
+plot_trajectory(trajectory, fitness[0])
 #end_main
@@ -2,6 +2,7 @@
 from random import Random
 from time import time
 from time import sleep
+import numpy
 import inspyred
 from tkinter import *
 import itertools
@@ -9,29 +10,22 @@ import itertools
 
 
 def area(p):
-    return 0.5 * abs(sum([x0*y1 - x1*y0 for ((x0, y0), (x1, y1)) in segments(p)]))
-
-def segments(p):
-    return list(zip(p, p[1:] + [p[0]]))
+    p = numpy.asarray(p, dtype=numpy.float64)
+    x, y = p[..., 0], p[..., 1]
+    x1, y1 = numpy.roll(x, -1, axis=-1), numpy.roll(y, -1, axis=-1)
+    return 0.5 * numpy.abs((x * y1 - x1 * y).sum(axis=-1))
 
 def generate_polygon(random, args):
     size = args.get('num_vertices', 6)
-    return [(random.uniform(-1, 1), random.uniform(-1, 1)) for i in range(size)]
+    return inspyred.ec.utilities.numpy_random(random, args).uniform(-1, 1, (size, 2))
 
+@inspyred.ec.utilities.memoize(maxlen=4096)
 def evaluate_polygon(candidates, args):
-    fitness = []
-    for cs in candidates:
-        fit = area(cs)
-        fitness.append(fit)
-    return fitness
+    return area(candidates).tolist()
 
 #start_bounder    
 def bound_polygon(candidate, args):
-    for i, c in enumerate(candidate):
-        x = max(min(c[0], 1), -1)
-        y = max(min(c[1], 1), -1)
-        candidate[i] = (x, y)
-    return candidate
+    return numpy.clip(candidate, -1, 1, out=candidate)
 bound_polygon.lower_bound = itertools.repeat(-1)
 bound_polygon.upper_bound = itertools.repeat(1)
 #end_bounder
@@ -39,14 +33,17 @@ bound_polygon.upper_bound = itertools.repeat(1)
 def mutate_polygon(random, candidates, args):
     mut_rate = args.setdefault('mutation_rate', 0.1)
     bounder = args['_ec'].bounder
-    for i, cs in enumerate(candidates):
-        for j, (c, lo, hi) in enumerate(zip(cs, bounder.lower_bound, bounder.upper_bound)):
-            if random.random() < mut_rate:
-                x = c[0] + random.gauss(0, 1) * (hi - lo)
-                y = c[1] + random.gauss(0, 1) * (hi - lo)
-                candidates[i][j] = (x, y)
-        candidates[i] = bounder(candidates[i], args)
-    return candidates
+    # Draw all of the mutation decisions and offsets at once.
+    rng = inspyred.ec.utilities.numpy_random(random, args)
+    polygons = numpy.asarray(candidates, dtype=numpy.float64)
+    num_vertices = polygons.shape[1]
+    lo = numpy.fromiter(itertools.islice(bounder.lower_bound, num_vertices), dtype=numpy.float64)
+    hi = numpy.fromiter(itertools.islice(bounder.upper_bound, num_vertices), dtype=numpy.float64)
+    mutate = rng.random(polygons.shape[:2]) < mut_rate
+    offsets = rng.standard_normal(polygons.shape) * (hi - lo)[:, numpy.newaxis]
+    polygons[mutate] += offsets[mutate]
+    numpy.clip(polygons, lo[:, numpy.newaxis], hi[:, numpy.newaxis], out=polygons)
+    return list(polygons)
         
 def polygon_observer(population, num_generations, num_evaluations, args):
     try:
@@ -57,7 +54,7 @@ def polygon_observer(population, num_generations, num_evaluations, args):
         
     # Get the best polygon in the population.
     poly = population[0].candidate
-    coords = [(100*x + 200, -100*y + 200) for (x, y) in poly]
+    coords = [(100*x + 200, -100*y + 200) for (x, y) in poly.tolist()]
     old_polys = canvas.find_withtag('poly')
     for p in old_polys:
         canvas.delete(p)
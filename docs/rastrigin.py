@@ -1,8 +1,7 @@
 #start_imports
 from random import Random
 from time import time
-from math import cos
-from math import pi
+import numpy
 from inspyred import ec
 from inspyred.ec import terminators
 #end_imports
@@ -10,14 +9,12 @@ from inspyred.ec import terminators
 
 def generate_rastrigin(random, args):
     size = args.get('num_inputs', 10)
-    return [random.uniform(-5.12, 5.12) for i in range(size)]
+    return ec.utilities.numpy_random(random, args).uniform(-5.12, 5.12, size).tolist()
 
 def evaluate_rastrigin(candidates, args):
-    fitness = []
-    for cs in candidates:
-        fit = 10 * len(cs) + sum([((x - 1)**2 - 10 * cos(2 * pi * (x - 1))) for x in cs])
-        fitness.append(fit)
-    return fitness
+    x = numpy.asarray(candidates, dtype=numpy.float64) - 1
+    fitness = 10 * x.shape[1] + (x**2 - 10 * numpy.cos(2 * numpy.pi * x)).sum(axis=1)
+    return fitness.tolist()
 
 #start_main
 rand = Random()
@@ -3,8 +3,9 @@ from examples.advanced import knapsack_ec_example
 from examples.advanced import niche_example
 from examples.advanced import parallel_evaluation_mp_example
 from examples.advanced import parallel_evaluation_pp_example
+from examples.advanced import parallel_evaluation_shm_example
 from examples.advanced import tsp_ec_example
 
 __all__ = ['knapsack_acs_example', 'knapsack_ec_example', 'niche_example', 
            'parallel_evaluation_mp_example', 'parallel_evaluation_pp_example',
-           'tsp_ec_example']
+           'parallel_evaluation_shm_example', 'tsp_ec_example']
@@ -1,8 +1,12 @@
 import random
 import time
-import multiprocessing
+import concurrent.futures
 import inspyred
 
+# Set once in each worker process by initialize_island_worker.
+worker_problem = None
+worker_migrator = None
+
 def create_island(rand_seed, island_number, problem, mp_migrator):
     evals = 200
     psize = 20
@@ -28,16 +32,26 @@ def create_island(rand_seed, island_number, problem, mp_migrator):
                           evaluate_migrant=False)
     
 
+def initialize_island_worker(problem, mp_migrator):
+    # The migrator's queue can only be shared with a worker process
+    # when that process is started, so it is handed over here once
+    # (along with the problem) rather than with every island.
+    global worker_problem, worker_migrator
+    worker_problem = problem
+    worker_migrator = mp_migrator
+
+def run_island(rand_seed, island_number):
+    create_island(rand_seed, island_number, worker_problem, worker_migrator)
+
+
 if __name__ == "__main__":  
     cpus = 2
     problem = inspyred.benchmarks.Rastrigin(2)
     mp_migrator = inspyred.ec.migrators.MultiprocessingMigrator(1)
     rand_seed = int(time.time())
-    jobs = []
-    for i in range(cpus):
-        p = multiprocessing.Process(target=create_island, args=(rand_seed + i, i, problem, mp_migrator))
-        p.start()
-        jobs.append(p)
-    for j in jobs:
-        j.join()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=cpus, 
+                                                initializer=initialize_island_worker,
+                                                initargs=(problem, mp_migrator)) as pool:
+        seeds = [rand_seed + i for i in range(cpus)]
+        list(pool.map(run_island, seeds, range(cpus), chunksize=1))
 
@@ -12,12 +12,14 @@ def generate_rastrigin(random, args):
     size = args.get('num_inputs', 10)
     return [random.uniform(-5.12, 5.12) for i in range(size)]
 
+TWO_PI = 2 * math.pi
+
 def evaluate_rastrigin(candidates, args):
     fitness = []
     for cs in candidates:
-        fit = 10 * len(cs) + sum([(my_squaring_function(x - 1) - 
-                                   10 * math.cos(2 * math.pi * (x - 1))) 
-                                   for x in cs])
+        shifted = [x - 1 for x in cs]
+        fit = 10 * len(cs) + sum([(my_squaring_function(x) - 10 * math.cos(TWO_PI * x)) 
+                                  for x in shifted])
         fitness.append(fit)
     if any([f < 9.5 for f in fitness]):
         raise TypeError
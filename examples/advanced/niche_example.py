@@ -2,20 +2,20 @@ import random
 import time
 import math
 import itertools
+import numpy
 import inspyred
 
 def my_distance(x, y):
-    return sum([abs(a - b) for a, b in zip(x, y)])
+    # The candidates in this example hold a single value, so the
+    # Manhattan distance between them is just their difference.
+    return abs(x[0] - y[0])
 
 def generate(random, args):
     return [random.uniform(0, 26)]
     
 def evaluate(candidates, args):
-    fitness = []
-    for cand in candidates:
-        fit = sum([math.sin(c) for c in cand])
-        fitness.append(fit)
-    return fitness
+    x = numpy.asarray(candidates, dtype=numpy.float64).reshape(len(candidates), -1)
+    return numpy.sin(x).sum(axis=1).tolist()
 
 def main(prng=None, display=False):
     if prng is None:
@@ -1,20 +1,25 @@
 from random import Random
 from time import time
+import numpy
 import inspyred
-import math
 
 def generate_rastrigin(random, args):
     size = args.get('num_inputs', 10)
-    return [random.uniform(-5.12, 5.12) for i in range(size)]
+    return inspyred.ec.utilities.numpy_random(random, args).uniform(-5.12, 5.12, size).tolist()
+
+def rastrigin_batch(x):
+    # x is a (candidates, inputs) float64 array; the temporaries are
+    # reused in place so each element is only touched a few times.
+    x = x - 1
+    terms = numpy.multiply(x, 2 * numpy.pi)
+    numpy.cos(terms, out=terms)
+    terms *= -10
+    x *= x
+    terms += x
+    return terms.sum(axis=1) + 10 * x.shape[1]
 
 def evaluate_rastrigin(candidates, args):
-    fitness = []
-    for cs in candidates:
-        fit = 10 * len(cs) + sum([((x - 1)**2 - 10 * 
-                                   math.cos(2 * math.pi * (x - 1))) 
-                                   for x in cs])
-        fitness.append(fit)
-    return fitness
+    return rastrigin_batch(numpy.asarray(candidates, dtype=numpy.float64)).tolist()
     
 def main(prng=None, display=False):    
     if prng is None:
@@ -1,7 +1,7 @@
 from random import Random
 from time import time
+import numpy
 import inspyred
-import math
 
 # Define an additional "necessary" function for the evaluator
 # to see how it must be handled when using ppft.
@@ -10,16 +10,12 @@ def my_squaring_function(x):
 
 def generate_rastrigin(random, args):
     size = args.get('num_inputs', 10)
-    return [random.uniform(-5.12, 5.12) for i in range(size)]
+    return inspyred.ec.utilities.numpy_random(random, args).uniform(-5.12, 5.12, size).tolist()
 
 def evaluate_rastrigin(candidates, args):
-    fitness = []
-    for cs in candidates:
-        fit = 10 * len(cs) + sum([(my_squaring_function(x - 1) -
-                                   10 * math.cos(2 * math.pi * (x - 1)))
-                                   for x in cs])
-        fitness.append(fit)
-    return fitness
+    x = numpy.asarray(candidates, dtype=numpy.float64) - 1
+    fitness = 10 * x.shape[1] + (my_squaring_function(x) - 10 * numpy.cos(2 * numpy.pi * x)).sum(axis=1)
+    return fitness.tolist()
 
 def main(prng=None, display=False):
     if prng is None:
@@ -34,7 +30,7 @@ def main(prng=None, display=False):
                           evaluator=inspyred.ec.evaluators.parallel_evaluation_pp,
                           pp_evaluator=evaluate_rastrigin,
                           pp_dependencies=(my_squaring_function,),
-                          pp_modules=("math",),
+                          pp_modules=("numpy",),
                           pop_size=8,
                           bounder=inspyred.ec.Bounder(-5.12, 5.12),
                           maximize=False,
@@ -0,0 +1,107 @@
+from random import Random
+from time import time
+from contextlib import contextmanager
+from multiprocessing import Pool, cpu_count, shared_memory
+from multiprocessing.util import Finalize
+import numpy
+import inspyred
+from examples.advanced.parallel_evaluation_mp_example import generate_rastrigin, rastrigin_batch
+
+# Set once in each worker process by attach_shared_candidates.
+shared_block = None
+shared_candidates = None
+
+def attach_shared_candidates(name, shape):
+    global shared_block, shared_candidates
+    shared_block = shared_memory.SharedMemory(name=name)
+    shared_candidates = numpy.ndarray(shape, dtype=numpy.float64, buffer=shared_block.buf)
+    # Close this worker's handle on the block when the pool shuts it down.
+    Finalize(None, detach_shared_candidates, exitpriority=10)
+
+def detach_shared_candidates():
+    global shared_block, shared_candidates
+    shared_candidates = None
+    shared_block.close()
+    shared_block = None
+
+def evaluate_rows(bounds):
+    lo, hi = bounds
+    return rastrigin_batch(shared_candidates[lo:hi]).tolist()
+
+@contextmanager
+def shared_rastrigin_evaluator(nprocs=None):
+    # The worker pool and the shared candidate block are created on the
+    # first evaluation and reused afterwards. Each generation only copies
+    # the candidates into shared memory and sends every worker a pair of
+    # row bounds, so nothing is forked or pickled per candidate. Both are
+    # released when the with-block ends.
+    if nprocs is None:
+        nprocs = cpu_count()
+    state = {}
+    
+    def release(failed=False):
+        # The workers must be gone before the block is unlinked. Closing
+        # the pool lets them exit normally and close their own handles,
+        # but after a failure they are terminated rather than waited on.
+        if 'pool' in state:
+            pool = state.pop('pool')
+            if failed:
+                pool.terminate()
+            else:
+                pool.close()
+            pool.join()
+            del state['view']
+            block = state.pop('block')
+            block.close()
+            block.unlink()
+    
+    def evaluate(candidates, args):
+        n = len(candidates)
+        if n == 0:
+            return []
+        candidates = numpy.asarray(candidates, dtype=numpy.float64)
+        view = state.get('view')
+        if view is None or view.shape[0] < n or view.shape[1:] != candidates.shape[1:]:
+            release()
+            block = shared_memory.SharedMemory(create=True, size=candidates.nbytes)
+            state['block'] = block
+            state['view'] = view = numpy.ndarray(candidates.shape, dtype=numpy.float64, buffer=block.buf)
+            state['pool'] = Pool(nprocs, initializer=attach_shared_candidates, 
+                                 initargs=(block.name, candidates.shape))
+        view[:n] = candidates
+        step = -(-n // nprocs)
+        bounds = [(lo, min(lo + step, n)) for lo in range(0, n, step)]
+        return [f for rows in state['pool'].map(evaluate_rows, bounds) for f in rows]
+    
+    try:
+        yield evaluate
+    except BaseException:
+        release(failed=True)
+        raise
+    release()
+    
+def main(prng=None, display=False):    
+    if prng is None:
+        prng = Random()
+        prng.seed(time()) 
+
+    ea = inspyred.ec.DEA(prng)
+    if display:
+        ea.observer = inspyred.ec.observers.stats_observer 
+    ea.terminator = inspyred.ec.terminators.evaluation_termination
+    with shared_rastrigin_evaluator(nprocs=8) as evaluate_rastrigin:
+        final_pop = ea.evolve(generator=generate_rastrigin, 
+                              evaluator=evaluate_rastrigin,
+                              pop_size=8, 
+                              bounder=inspyred.ec.Bounder(-5.12, 5.12),
+                              maximize=False,
+                              max_evaluations=256,
+                              num_inputs=3)
+                          
+    if display:
+        best = max(final_pop) 
+        print('Best Solution: \n{0}'.format(str(best)))
+    return ea
+            
+if __name__ == '__main__':
+    main(display=True)
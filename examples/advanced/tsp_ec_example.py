@@ -1,6 +1,6 @@
 from random import Random
 from time import time
-import math
+import numpy
 import inspyred
 
 
@@ -12,10 +12,10 @@ def main(prng=None, display=False):
     points = [(110.0, 225.0), (161.0, 280.0), (325.0, 554.0), (490.0, 285.0), 
               (157.0, 443.0), (283.0, 379.0), (397.0, 566.0), (306.0, 360.0), 
               (343.0, 110.0), (552.0, 199.0)]
-    weights = [[0 for _ in range(len(points))] for _ in range(len(points))]
-    for i, p in enumerate(points):
-        for j, q in enumerate(points):
-            weights[i][j] = math.sqrt((p[0] - q[0])**2 + (p[1] - q[1])**2)
+    # All of the pairwise distances are found at once by broadcasting.
+    coords = numpy.asarray(points)
+    diff = coords[:, numpy.newaxis, :] - coords[numpy.newaxis, :, :]
+    weights = numpy.sqrt((diff * diff).sum(axis=-1)).tolist()
               
     problem = inspyred.benchmarks.TSP(weights)
     ea = inspyred.ec.EvolutionaryComputation(prng)
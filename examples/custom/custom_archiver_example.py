@@ -3,13 +3,11 @@ from time import time
 import inspyred
 
 def my_archiver(random, population, archive, args):
+    # The archive only ever holds the single worst individual seen so
+    # far, so it can be compared directly instead of being searched.
     worst_in_pop = min(population)
-    if len(archive) > 0:
-        worst_in_arc = min(archive)
-        if worst_in_pop < worst_in_arc:
-            return [worst_in_pop]
-        else:
-            return archive
+    if len(archive) > 0 and not worst_in_pop < archive[0]:
+        return archive
     else:
         return [worst_in_pop]
 
@@ -4,14 +4,12 @@ import inspyred
 
 def my_selector(random, population, args):
     n = args.get('num_selected', 2)
+    # All of the coin flips and random picks are drawn at once.
+    rng = inspyred.ec.utilities.numpy_random(random, args)
+    coins = rng.random(n).tolist()
+    picks = rng.integers(0, len(population), n).tolist()
     best = max(population)
-    selected = []
-    for i in range(n):
-        if random.random() <= 0.5:
-            selected.append(best)
-        else:
-            selected.append(random.choice(population))
-    return selected
+    return [best if c <= 0.5 else population[i] for c, i in zip(coins, picks)]
 
 if __name__ == '__main__':
     prng = Random()
@@ -1,14 +1,20 @@
 from random import Random
 from time import time
-import itertools
+import numpy
 import inspyred
 
 def my_terminator(population, num_generations, num_evaluations, args):
     min_ham_dist = args.get('minimum_hamming_distance', 30)
-    ham_dist = []
-    for x, y in itertools.combinations(population, 2):
-        ham_dist.append(sum(a != b for a, b in zip(x.candidate, y.candidate)))
-    avg_ham_dist = sum(ham_dist) / float(len(ham_dist))
+    # A single individual has no pairs and so no diversity left.
+    if len(population) < 2:
+        return True
+    # The candidates are assumed to be binary (all 0s and 1s). Then each
+    # bit position adds ones * zeros to the total Hamming distance over
+    # all pairs, so no pairs need to be formed.
+    bits = numpy.array([p.candidate for p in population], dtype=numpy.int64)
+    ones = bits.sum(axis=0)
+    num_pairs = len(population) * (len(population) - 1) / 2.0
+    avg_ham_dist = (ones * (len(population) - ones)).sum() / num_pairs
     return avg_ham_dist <= min_ham_dist
         
 
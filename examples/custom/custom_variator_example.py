@@ -12,12 +12,12 @@ import inspyred
 def my_variator(random, candidates, args):
     mutants = []
     for c in candidates:
-        points = random.sample(list(range(len(c))), 2)
+        points = random.sample(range(len(c)), 2)
         x, y = min(points), max(points)
-        if x == 0:
-            mutants.append(c[y::-1] + c[y+1:])
-        else:
-            mutants.append(c[:x] + c[y:x-1:-1] + c[y+1:])
+        # The candidates are already copies of their parents, so the
+        # segment can be inverted in place.
+        c[x:y+1] = reversed(c[x:y+1])
+        mutants.append(c)
     return mutants
 
 if __name__ == '__main__':
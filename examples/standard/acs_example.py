@@ -1,21 +1,22 @@
 from random import Random
 from time import time
-import math
+import numpy
 import inspyred
 
+# The cities and their pairwise distances never change, so they are
+# computed once when the module is imported rather than on every run.
+points = [(110.0, 225.0), (161.0, 280.0), (325.0, 554.0), (490.0, 285.0), 
+          (157.0, 443.0), (283.0, 379.0), (397.0, 566.0), (306.0, 360.0), 
+          (343.0, 110.0), (552.0, 199.0)]
+_pts = numpy.array(points)
+_diff = _pts[:, numpy.newaxis, :] - _pts[numpy.newaxis, :, :]
+weights = numpy.sqrt((_diff * _diff).sum(axis=-1)).tolist()
+
 def main(prng=None, display=False):    
     if prng is None:
         prng = Random()
         prng.seed(time()) 
         
-    points = [(110.0, 225.0), (161.0, 280.0), (325.0, 554.0), (490.0, 285.0), 
-              (157.0, 443.0), (283.0, 379.0), (397.0, 566.0), (306.0, 360.0), 
-              (343.0, 110.0), (552.0, 199.0)]
-    weights = [[0 for _ in range(len(points))] for _ in range(len(points))]
-    for i, p in enumerate(points):
-        for j, q in enumerate(points):
-            weights[i][j] = math.sqrt((p[0] - q[0])**2 + (p[1] - q[1])**2)
-              
     problem = inspyred.benchmarks.TSP(weights)
     ac = inspyred.swarm.ACS(prng, problem.components)
     ac.terminator = inspyred.ec.terminators.generation_termination
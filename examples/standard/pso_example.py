@@ -10,7 +10,7 @@ def main(prng=None, display=False):
     problem = inspyred.benchmarks.Ackley(2)
     ea = inspyred.swarm.PSO(prng)
     ea.terminator = inspyred.ec.terminators.evaluation_termination
-    ea.topology = inspyred.swarm.topologies.ring_topology
+    ea.topology = inspyred.swarm.topologies.numpy_ring_topology
     final_pop = ea.evolve(generator=problem.generator,
                           evaluator=problem.evaluator, 
                           pop_size=100,
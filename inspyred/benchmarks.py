@@ -32,12 +32,70 @@ import warnings
 import copy
 from inspyred import ec
 from inspyred.ec import emo
-from inspyred.ec import selectors
 from inspyred import swarm
 import itertools
 import math
 import random
-from functools import reduce
+import numpy
+
+
+_HALF_PI = math.pi / 2.0
+_THREE_PI = 3.0 * math.pi
+
+
+def _candidate_array(candidates, args):
+    # Stack the candidates into a (len(candidates), n) array so that an
+    # evaluator can compute the whole batch in one pass. The array is
+    # float64 unless benchmark_dtype asks for something narrower.
+    x = numpy.asarray(candidates, dtype=args.get('benchmark_dtype', numpy.float64))
+    if x.ndim != 2:
+        x = x.reshape(len(candidates), -1 if x.size else 0)
+    return x
+
+def _pareto_list(fit):
+    # Wrap each row of an (n, objectives) array in an emo.Pareto with a
+    # single tolist conversion and no per-candidate Python-level loop.
+    return list(map(emo.Pareto, fit.tolist()))
+
+def _degenerate_angles(x, gval):
+    # The angles for DTLZ5 and DTLZ6, where only the first input maps
+    # straight onto a quarter turn and the rest are squeezed towards
+    # pi/4 as g grows, so that the front degenerates to a curve.
+    scale = (math.pi / (4.0 * (1 + gval)))[:, numpy.newaxis]
+    spread = scale * (1 + 2 * gval[:, numpy.newaxis] * x[:, 1:])
+    return numpy.hstack([x[:, :1] * _HALF_PI, spread])
+
+def _choose_component(random, components, bias):
+    # Choose the next trail component for an ant. With probability bias
+    # this is the most desirable component; otherwise it is drawn in
+    # proportion to desirability, just as fitness_proportionate_selection
+    # would, but from an array of the fitnesses (which are always positive
+    # for trail components) rather than by comparing and sorting the
+    # components themselves.
+    fitness = numpy.array([c.fitness for c in components], dtype=numpy.float64)
+    if random.random() <= bias:
+        return components[int(fitness.argmax())]
+    if fitness.max() == fitness.min():
+        order = numpy.arange(len(components))
+        psum = numpy.arange(1, len(components) + 1) / float(len(components))
+    else:
+        order = numpy.argsort(-fitness, kind='stable')
+        psum = numpy.cumsum(fitness[order])
+        psum /= psum[-1]
+    i = min(int(numpy.searchsorted(psum, random.random(), side='right')), len(components) - 1)
+    return components[order[i]]
+
+def _spherical_objectives(theta, gval):
+    # Objective vectors of the form used by DTLZ2 through DTLZ6, where
+    # f_1 is the product of every cos(theta_j) and f_i, counting down,
+    # swaps the last cosine of a shorter product for sin(theta_{m-i+1}).
+    # Column j of prefix is the product of the first j cosines, so each
+    # cosine and sine is computed once per candidate.
+    k = theta.shape[1]
+    prefix = numpy.hstack([numpy.ones((len(theta), 1), dtype=theta.dtype), numpy.cumprod(numpy.cos(theta), axis=1)])
+    fit = numpy.hstack([prefix[:, k:], (prefix[:, :k] * numpy.sin(theta))[:, ::-1]])
+    fit *= (1 + gval)[:, numpy.newaxis]
+    return fit
 
 
 class Benchmark(object):
@@ -59,6 +117,21 @@ class Benchmark(object):
         my_function = benchmarks.Ackley(2)
         output = my_function(-1.5, 4.2)
 
+    The ``evaluator`` of a benchmark computes a whole population at once,
+    and it can be pickled, so it can also be handed to a master-slave
+    evaluator. For instance, passing ``evaluator=inspyred.ec.evaluators.parallel_evaluation_mp``
+    and ``mp_evaluator=problem.evaluator`` to ``evolve`` splits each
+    population into one contiguous block per worker process.
+
+    The vectorized evaluators work in float64 by default. Passing
+    ``benchmark_dtype=numpy.float32`` to ``evolve`` (or in the ``args``
+    of a direct evaluator call) makes them compute in single precision
+    instead, which is noticeably faster for large populations. The
+    fitness values are then only accurate to about six significant
+    digits, and less on problems such as Kursawe and DTLZ3 that take the
+    sine or cosine of large arguments. This can hide the differences
+    between nearly equal solutions close to an optimum.
+
     Public Attributes:
 
     - *dimensions* -- the number of inputs to the problem
@@ -88,13 +161,39 @@ class Benchmark(object):
         raise NotImplementedError
 
     def evaluator(self, candidates, args):
-        """The evaluator function for the benchmark problem."""
+        """The evaluator function for the benchmark problem.
+
+        By default, the candidates are stacked into a single array that is
+        passed to ``ndarray_evaluator``, and the fitness values it returns
+        are converted back into floats (or into ``emo.Pareto`` values for
+        multiobjective problems). Candidates of different lengths cannot be
+        stacked, so in that case each one is evaluated on its own.
+
+        """
+        try:
+            x = _candidate_array(candidates, args)
+        except ValueError:
+            if len(candidates) < 2:
+                raise
+            return [self.evaluator([c], args)[0] for c in candidates]
+        fit = self.ndarray_evaluator(x, args)
+        if fit.ndim > 1:
+            return _pareto_list(fit)
+        else:
+            return fit.tolist()
+
+    def ndarray_evaluator(self, x, args):
+        """Evaluate a whole population stored as a NumPy array.
+
+        Here, *x* is a (candidates, dimensions) array. The return value is
+        an array with one fitness per candidate or, for multiobjective
+        problems, one row of objective values per candidate.
+
+        """
         raise NotImplementedError
 
     def __call__(self, *args, **kwargs):
-        candidate = [a for a in args]
-        fit = self.evaluator([candidate], kwargs)
-        return fit[0]
+        return self.evaluator([list(args)], kwargs)[0]
 
 class Binary(Benchmark):
     """Defines a binary problem based on an existing benchmark problem.
@@ -130,23 +229,40 @@ class Binary(Benchmark):
         self.bounder = ec.DiscreteBounder([0, 1])
         self.maximize = self.benchmark.maximize
         self.__class__.__name__ = self.__class__.__name__ + ' ' + self.benchmark.__class__.__name__
+        # The place value of each bit and the bounds of the original
+        # problem are fixed, so they are only built once for all batches.
+        self._bit_weights = numpy.left_shift(numpy.uint64(1), numpy.arange(dimension_bits - 1, -1, -1, dtype=numpy.uint64))
+        self._real_lower = numpy.fromiter(itertools.islice(benchmark.bounder.lower_bound, self.dimensions), numpy.float64)
+        self._real_upper = numpy.fromiter(itertools.islice(benchmark.bounder.upper_bound, self.dimensions), numpy.float64)
 
     def _binary_to_real(self, binary):
         real = []
-        for d, lo, hi in zip(list(range(self.dimensions)), self.benchmark.bounder.lower_bound, self.benchmark.bounder.upper_bound):
+        for d, lo, hi in zip(range(self.dimensions), self.benchmark.bounder.lower_bound, self.benchmark.bounder.upper_bound):
             b = binary[d*self.dimension_bits:(d+1)*self.dimension_bits]
             real_val = float(int(''.join([str(i) for i in b]), 2))
             value = real_val / (2**(self.dimension_bits)-1) * (hi - lo) + lo
             real.append(value)
         return real
 
+    def _binary_to_real_batch(self, candidates):
+        # Pack each group of dimension_bits bits (most significant first)
+        # into one unsigned integer for every candidate at once, and then
+        # scale those integers into the bounds of the original problem.
+        n = len(candidates)
+        bits = numpy.asarray(candidates, dtype=numpy.uint64)
+        bits = bits[:, :self.dimensions * self.dimension_bits].reshape(n, self.dimensions, self.dimension_bits)
+        packed = bits @ self._bit_weights
+        lo, hi = self._real_lower, self._real_upper
+        return packed / (2**(self.dimension_bits)-1) * (hi - lo) + lo
+
     def generator(self, random, args):
-        return [random.choice([0, 1]) for _ in range(self.dimensions * self.dimension_bits)]
+        return ec.utilities.numpy_random(random, args).integers(0, 2, self.dimensions * self.dimension_bits).tolist()
 
     def evaluator(self, candidates, args):
-        real_candidates = []
-        for c in candidates:
-            real_candidates.append(self._binary_to_real(c))
+        if 0 < len(candidates) and self.dimension_bits <= 64:
+            real_candidates = self._binary_to_real_batch(candidates).tolist()
+        else:
+            real_candidates = [self._binary_to_real(c) for c in candidates]
         return self.benchmark.evaluator(real_candidates, args)
 
 
@@ -187,14 +303,12 @@ class Ackley(Benchmark):
         self.global_optimum = [0 for _ in range(self.dimensions)]
 
     def generator(self, random, args):
-        return [random.uniform(-32.0, 32.0) for _ in range(self.dimensions)]
+        return ec.utilities.numpy_random(random, args).uniform(-32.0, 32.0, self.dimensions).tolist()
 
-    def evaluator(self, candidates, args):
-        fitness = []
-        for c in candidates:
-            fitness.append(-20 * math.exp(-0.2 * math.sqrt(1.0 / self.dimensions * sum([x**2 for x in c]))) -
-                           math.exp(1.0 / self.dimensions * sum([math.cos(2 * math.pi * x) for x in c])) + 20 + math.e)
-        return fitness
+    def ndarray_evaluator(self, x, args):
+        mean_square = (x * x).sum(axis=1) / self.dimensions
+        mean_cosine = numpy.cos(2 * math.pi * x).sum(axis=1) / self.dimensions
+        return -20 * numpy.exp(-0.2 * numpy.sqrt(mean_square)) - numpy.exp(mean_cosine) + 20 + math.e
 
 class Griewank(Benchmark):
     """Defines the Griewank benchmark problem.
@@ -227,18 +341,18 @@ class Griewank(Benchmark):
         self.bounder = ec.Bounder([-600.0] * self.dimensions, [600.0] * self.dimensions)
         self.maximize = False
         self.global_optimum = [0 for _ in range(self.dimensions)]
+        self._sqrt_index = numpy.sqrt(numpy.arange(1, self.dimensions + 1, dtype=numpy.float64))
 
     def generator(self, random, args):
-        return [random.uniform(-600.0, 600.0) for _ in range(self.dimensions)]
+        return ec.utilities.numpy_random(random, args).uniform(-600.0, 600.0, self.dimensions).tolist()
 
-    def evaluator(self, candidates, args):
-        fitness = []
-        for c in candidates:
-            prod = 1
-            for i, x in enumerate(c):
-                prod *= math.cos(x / math.sqrt(i+1))
-            fitness.append(1.0 / 4000.0 * sum([x**2 for x in c]) - prod + 1)
-        return fitness
+    def ndarray_evaluator(self, x, args):
+        if x.shape[1] == self.dimensions:
+            sqrt_index = self._sqrt_index
+        else:
+            sqrt_index = numpy.sqrt(numpy.arange(1, x.shape[1] + 1, dtype=numpy.float64))
+        prod = numpy.cos(x / sqrt_index.astype(x.dtype)).prod(axis=1)
+        return 1.0 / 4000.0 * (x * x).sum(axis=1) - prod + 1
 
 class Rastrigin(Benchmark):
     """Defines the Rastrigin benchmark problem.
@@ -273,13 +387,11 @@ class Rastrigin(Benchmark):
         self.global_optimum = [0 for _ in range(self.dimensions)]
 
     def generator(self, random, args):
-        return [random.uniform(-5.12, 5.12) for _ in range(self.dimensions)]
+        return ec.utilities.numpy_random(random, args).uniform(-5.12, 5.12, self.dimensions).tolist()
 
-    def evaluator(self, candidates, args):
-        fitness = []
-        for c in candidates:
-            fitness.append(sum([x**2 - 10 * math.cos(2 * math.pi * x) + 10 for x in c]))
-        return fitness
+    def ndarray_evaluator(self, x, args):
+        # The constant 10 per input is added once for the whole row.
+        return (x * x - 10 * numpy.cos(2 * math.pi * x)).sum(axis=1) + 10 * x.shape[1]
 
 class Rosenbrock(Benchmark):
     """Defines the Rosenbrock benchmark problem.
@@ -315,16 +427,11 @@ class Rosenbrock(Benchmark):
         self.global_optimum = [1 for _ in range(self.dimensions)]
 
     def generator(self, random, args):
-        return [random.uniform(-5.0, 10.0) for _ in range(self.dimensions)]
+        return ec.utilities.numpy_random(random, args).uniform(-5.0, 10.0, self.dimensions).tolist()
 
-    def evaluator(self, candidates, args):
-        fitness = []
-        for c in candidates:
-            total = 0
-            for i in range(len(c) - 1):
-                total += 100 * (c[i]**2 - c[i+1])**2 + (c[i] - 1)**2
-            fitness.append(total)
-        return fitness
+    def ndarray_evaluator(self, x, args):
+        head, tail = x[:, :-1], x[:, 1:]
+        return (100 * (head * head - tail)**2 + (head - 1)**2).sum(axis=1)
 
 class Schwefel(Benchmark):
     """Defines the Schwefel benchmark problem.
@@ -356,15 +463,13 @@ class Schwefel(Benchmark):
         self.bounder = ec.Bounder([-500.0] * self.dimensions, [500.0] * self.dimensions)
         self.maximize = False
         self.global_optimum = [420.9687 for _ in range(self.dimensions)]
+        self._offset = 418.9829 * self.dimensions
 
     def generator(self, random, args):
-        return [random.uniform(-500.0, 500.0) for _ in range(self.dimensions)]
+        return ec.utilities.numpy_random(random, args).uniform(-500.0, 500.0, self.dimensions).tolist()
 
-    def evaluator(self, candidates, args):
-        fitness = []
-        for c in candidates:
-            fitness.append(418.9829 * self.dimensions - sum([x * math.sin(math.sqrt(abs(x))) for x in c]))
-        return fitness
+    def ndarray_evaluator(self, x, args):
+        return self._offset - (x * numpy.sin(numpy.sqrt(numpy.abs(x)))).sum(axis=1)
 
 class Sphere(Benchmark):
     """Defines the Sphere benchmark problem.
@@ -399,13 +504,18 @@ class Sphere(Benchmark):
         self.global_optimum = [0 for _ in range(self.dimensions)]
 
     def generator(self, random, args):
-        return [random.uniform(-5.12, 5.12) for _ in range(self.dimensions)]
+        return ec.utilities.numpy_random(random, args).uniform(-5.12, 5.12, self.dimensions).tolist()
 
     def evaluator(self, candidates, args):
-        fitness = []
-        for c in candidates:
-            fitness.append(sum([x**2 for x in c]))
-        return fitness
+        # The sum of squares is so cheap that converting a list population
+        # into an array costs more than evaluating it, so lists are summed
+        # directly and arrays go through ndarray_evaluator.
+        if isinstance(candidates, numpy.ndarray) or 'benchmark_dtype' in args:
+            return Benchmark.evaluator(self, candidates, args)
+        return [sum(v * v for v in c) for c in candidates]
+
+    def ndarray_evaluator(self, x, args):
+        return (x**2).sum(axis=1)
 
 
 #-----------------------------------------------------------------------
@@ -441,15 +551,13 @@ class Kursawe(Benchmark):
         self.maximize = False
 
     def generator(self, random, args):
-        return [random.uniform(-5.0, 5.0) for _ in range(self.dimensions)]
+        return ec.utilities.numpy_random(random, args).uniform(-5.0, 5.0, self.dimensions).tolist()
 
-    def evaluator(self, candidates, args):
-        fitness = []
-        for c in candidates:
-            f1 = sum([-10 * math.exp(-0.2 * math.sqrt(c[i]**2 + c[i+1]**2)) for i in range(len(c) - 1)])
-            f2 = sum([math.pow(abs(x), 0.8) + 5 * math.sin(x**3) for x in c])
-            fitness.append(emo.Pareto([f1, f2]))
-        return fitness
+    def ndarray_evaluator(self, x, args):
+        head, tail = x[:, :-1], x[:, 1:]
+        f1 = (-10 * numpy.exp(-0.2 * numpy.sqrt(head * head + tail * tail))).sum(axis=1)
+        f2 = (numpy.abs(x)**0.8 + 5 * numpy.sin(x * x * x)).sum(axis=1)
+        return numpy.column_stack([f1, f2])
 
 class DTLZ1(Benchmark):
     """Defines the DTLZ1 multiobjective benchmark problem.
@@ -505,18 +613,16 @@ class DTLZ1(Benchmark):
         return x
 
     def generator(self, random, args):
-        return [random.uniform(0.0, 1.0) for _ in range(self.dimensions)]
+        return ec.utilities.numpy_random(random, args).uniform(0.0, 1.0, self.dimensions).tolist()
 
-    def evaluator(self, candidates, args):
-        fitness = []
-        g = lambda x: 100 * (len(x) + sum([(a - 0.5)**2 - math.cos(20 * math.pi * (a - 0.5)) for a in x]))
-        for c in candidates:
-            gval = g(c[self.objectives-1:])
-            fit = [0.5 * reduce(lambda x,y: x*y, c[:self.objectives-1]) * (1 + gval)]
-            for m in reversed(list(range(1, self.objectives))):
-                fit.append(0.5 * reduce(lambda x,y: x*y, c[:m-1], 1) * (1 - c[m-1]) * (1 + gval))
-            fitness.append(emo.Pareto(fit))
-        return fitness
+    def ndarray_evaluator(self, x, args):
+        k = self.objectives - 1
+        xm = x[:, k:] - 0.5
+        gval = 100 * (xm.shape[1] + (xm**2 - numpy.cos(20 * math.pi * xm)).sum(axis=1))
+        # Column j of prefix is the product of the first j inputs.
+        prefix = numpy.hstack([numpy.ones((len(x), 1), dtype=x.dtype), numpy.cumprod(x[:, :k], axis=1)])
+        fit = numpy.hstack([prefix[:, k:], (prefix[:, :k] * (1 - x[:, :k]))[:, ::-1]])
+        return 0.5 * fit * (1 + gval)[:, numpy.newaxis]
 
 class DTLZ2(Benchmark):
     """Defines the DTLZ2 multiobjective benchmark problem.
@@ -564,21 +670,12 @@ class DTLZ2(Benchmark):
         return x
 
     def generator(self, random, args):
-        return [random.uniform(0.0, 1.0) for _ in range(self.dimensions)]
+        return ec.utilities.numpy_random(random, args).uniform(0.0, 1.0, self.dimensions).tolist()
 
-    def evaluator(self, candidates, args):
-        fitness = []
-        g = lambda x: sum([(a - 0.5)**2 for a in x])
-        for c in candidates:
-            gval = g(c[self.objectives-1:])
-            fit = [(1 + gval) *
-                   reduce(lambda x,y: x*y, [math.cos(a * math.pi / 2.0) for a in c[:self.objectives-1]])]
-            for m in reversed(list(range(1, self.objectives))):
-                fit.append((1 + gval) *
-                           reduce(lambda x,y: x*y, [math.cos(a * math.pi / 2.0) for a in c[:m-1]], 1) *
-                           math.sin(c[m-1] * math.pi / 2.0))
-            fitness.append(emo.Pareto(fit))
-        return fitness
+    def ndarray_evaluator(self, x, args):
+        k = self.objectives - 1
+        gval = ((x[:, k:] - 0.5)**2).sum(axis=1)
+        return _spherical_objectives(x[:, :k] * _HALF_PI, gval)
 
 class DTLZ3(Benchmark):
     """Defines the DTLZ3 multiobjective benchmark problem.
@@ -626,20 +723,13 @@ class DTLZ3(Benchmark):
         return x
 
     def generator(self, random, args):
-        return [random.uniform(0.0, 1.0) for _ in range(self.dimensions)]
+        return ec.utilities.numpy_random(random, args).uniform(0.0, 1.0, self.dimensions).tolist()
 
-    def evaluator(self, candidates, args):
-        fitness = []
-        g = lambda x: 100 * (len(x) + sum([(a - 0.5)**2 - math.cos(20 * math.pi * (a - 0.5)) for a in x]))
-        for c in candidates:
-            gval = g(c[self.objectives-1:])
-            fit = [(1 + gval) * reduce(lambda x,y: x*y, [math.cos(a * math.pi / 2.0) for a in c[:self.objectives-1]])]
-            for m in reversed(list(range(1, self.objectives))):
-                fit.append((1 + gval) *
-                           reduce(lambda x,y: x*y, [math.cos(a * math.pi / 2.0) for a in c[:m-1]], 1) *
-                           math.sin(c[m-1] * math.pi / 2.0))
-            fitness.append(emo.Pareto(fit))
-        return fitness
+    def ndarray_evaluator(self, x, args):
+        k = self.objectives - 1
+        xm = x[:, k:] - 0.5
+        gval = 100 * (xm.shape[1] + (xm**2 - numpy.cos(20 * math.pi * xm)).sum(axis=1))
+        return _spherical_objectives(x[:, :k] * _HALF_PI, gval)
 
 class DTLZ4(Benchmark):
     """Defines the DTLZ4 multiobjective benchmark problem.
@@ -688,21 +778,12 @@ class DTLZ4(Benchmark):
         return x
 
     def generator(self, random, args):
-        return [random.uniform(0.0, 1.0) for _ in range(self.dimensions)]
+        return ec.utilities.numpy_random(random, args).uniform(0.0, 1.0, self.dimensions).tolist()
 
-    def evaluator(self, candidates, args):
-        fitness = []
-        g = lambda x: sum([(a - 0.5)**2 for a in x])
-        for c in candidates:
-            gval = g(c[self.objectives-1:])
-            fit = [(1 + gval) *
-                   reduce(lambda x,y: x*y, [math.cos(a**self.alpha * math.pi / 2.0) for a in c[:self.objectives-1]])]
-            for m in reversed(list(range(1, self.objectives))):
-                fit.append((1 + gval) *
-                           reduce(lambda x,y: x*y, [math.cos(a**self.alpha * math.pi / 2.0) for a in c[:m-1]], 1) *
-                           math.sin(c[m-1]**self.alpha * math.pi / 2.0))
-            fitness.append(emo.Pareto(fit))
-        return fitness
+    def ndarray_evaluator(self, x, args):
+        k = self.objectives - 1
+        gval = ((x[:, k:] - 0.5)**2).sum(axis=1)
+        return _spherical_objectives(x[:, :k]**self.alpha * _HALF_PI, gval)
 
 class DTLZ5(Benchmark):
     """Defines the DTLZ5 multiobjective benchmark problem.
@@ -772,25 +853,12 @@ class DTLZ5(Benchmark):
         return x
 
     def generator(self, random, args):
-        return [random.uniform(0.0, 1.0) for _ in range(self.dimensions)]
+        return ec.utilities.numpy_random(random, args).uniform(0.0, 1.0, self.dimensions).tolist()
 
-    def evaluator(self, candidates, args):
-        fitness = []
-        g = lambda x: sum([(a - 0.5)**2 for a in x])
-        for c in candidates:
-            gval = g(c[self.objectives-1:])
-            theta = lambda x: math.pi / (4.0 * (1 + gval)) * (1 + 2 * gval * x)
-            fit = [(1 + gval) * math.cos(math.pi / 2.0 * c[0]) *
-                   reduce(lambda x,y: x*y, [math.cos(theta(a)) for a in c[1:self.objectives-1]])]
-            for m in reversed(list(range(1, self.objectives))):
-                if m == 1:
-                    fit.append((1 + gval) * math.sin(math.pi / 2.0 * c[0]))
-                else:
-                    fit.append((1 + gval) * math.cos(math.pi / 2.0 * c[0]) *
-                               reduce(lambda x,y: x*y, [math.cos(theta(a)) for a in c[1:m-1]], 1) *
-                               math.sin(theta(c[m-1])))
-            fitness.append(emo.Pareto(fit))
-        return fitness
+    def ndarray_evaluator(self, x, args):
+        k = self.objectives - 1
+        gval = ((x[:, k:] - 0.5)**2).sum(axis=1)
+        return _spherical_objectives(_degenerate_angles(x[:, :k], gval), gval)
 
 class DTLZ6(Benchmark):
     """Defines the DTLZ6 multiobjective benchmark problem.
@@ -839,25 +907,12 @@ class DTLZ6(Benchmark):
         return x
 
     def generator(self, random, args):
-        return [random.uniform(0.0, 1.0) for _ in range(self.dimensions)]
+        return ec.utilities.numpy_random(random, args).uniform(0.0, 1.0, self.dimensions).tolist()
 
-    def evaluator(self, candidates, args):
-        fitness = []
-        g = lambda x: sum([a**0.1 for a in x])
-        for c in candidates:
-            gval = g(c[self.objectives-1:])
-            theta = lambda x: math.pi / (4.0 * (1 + gval)) * (1 + 2 * gval * x)
-            fit = [(1 + gval) * math.cos(math.pi / 2.0 * c[0]) *
-                   reduce(lambda x,y: x*y, [math.cos(theta(a)) for a in c[1:self.objectives-1]])]
-            for m in reversed(list(range(1, self.objectives))):
-                if m == 1:
-                    fit.append((1 + gval) * math.sin(math.pi / 2.0 * c[0]))
-                else:
-                    fit.append((1 + gval) * math.cos(math.pi / 2.0 * c[0]) *
-                               reduce(lambda x,y: x*y, [math.cos(theta(a)) for a in c[1:m-1]], 1) *
-                               math.sin(theta(c[m-1])))
-            fitness.append(emo.Pareto(fit))
-        return fitness
+    def ndarray_evaluator(self, x, args):
+        k = self.objectives - 1
+        gval = (x[:, k:]**0.1).sum(axis=1)
+        return _spherical_objectives(_degenerate_angles(x[:, :k], gval), gval)
 
 class DTLZ7(Benchmark):
     """Defines the DTLZ7 multiobjective benchmark problem.
@@ -899,6 +954,7 @@ class DTLZ7(Benchmark):
             raise ValueError('dimensions ({0}) must be greater than or equal to objectives ({1})'.format(dimensions, objectives))
         self.bounder = ec.Bounder([0.0] * self.dimensions, [1.0] * self.dimensions)
         self.maximize = False
+        self._g_scale = 9.0 / (self.dimensions - self.objectives + 1)
 
     def global_optimum(self):
         """Return a globally optimal solution to this problem.
@@ -914,19 +970,18 @@ class DTLZ7(Benchmark):
         return x
 
     def generator(self, random, args):
-        return [random.uniform(0.0, 1.0) for _ in range(self.dimensions)]
+        return ec.utilities.numpy_random(random, args).uniform(0.0, 1.0, self.dimensions).tolist()
 
-    def evaluator(self, candidates, args):
-        fitness = []
-        g = lambda x: 1 + 9.0 / len(x) * sum([a for a in x])
-        for c in candidates:
-            gval = g(c[self.objectives-1:])
-            fit = []
-            for m in range(self.objectives-1):
-                fit.append(c[m])
-            fit.append((1 + gval) * (self.objectives - sum([a / (1.0 + gval) * (1 + math.sin(3 * math.pi * a)) for a in c[:self.objectives-1]])))
-            fitness.append(emo.Pareto(fit))
-        return fitness
+    def ndarray_evaluator(self, x, args):
+        k = self.objectives - 1
+        if x.shape[1] == self.dimensions or len(x) == 0:
+            g_scale = self._g_scale
+        else:
+            g_scale = 9.0 / (x.shape[1] - k)
+        gval = 1 + g_scale * x[:, k:].sum(axis=1)
+        head = x[:, :k]
+        h = (head / (1.0 + gval)[:, numpy.newaxis] * (1 + numpy.sin(_THREE_PI * head))).sum(axis=1)
+        return numpy.column_stack([head, (1 + gval) * (self.objectives - h)])
 
 
 #-----------------------------------------------------------------------
@@ -972,15 +1027,19 @@ class TSP(Benchmark):
     def __init__(self, weights):
         Benchmark.__init__(self, len(weights))
         self.weights = weights
-        self.components = [swarm.TrailComponent((i, j), value=(1 / weights[i][j])) for i, j in itertools.permutations(list(range(len(weights))), 2)]
+        self._weight_matrix = numpy.asarray(weights, dtype=numpy.float64)
+        self.components = [swarm.TrailComponent((i, j), value=(1 / weights[i][j])) for i, j in itertools.permutations(range(len(weights)), 2)]
+        self._components_from = [[] for _ in range(len(weights))]
+        for c in self.components:
+            self._components_from[c.element[0]].append(c)
         self.bias = 0.5
-        self.bounder = ec.DiscreteBounder([i for i in range(len(weights))])
+        self.bounder = ec.DiscreteBounder(list(range(len(weights))))
         self.maximize = True
         self._use_ants = False
 
     def generator(self, random, args):
         """Return a candidate solution for an evolutionary computation."""
-        locations = [i for i in range(len(self.weights))]
+        locations = list(range(len(self.weights)))
         random.shuffle(locations)
         return locations
 
@@ -988,6 +1047,7 @@ class TSP(Benchmark):
         """Return a candidate solution for an ant colony optimization."""
         self._use_ants = True
         candidate = []
+        visited = [False] * len(self.weights)
         while len(candidate) < len(self.weights) - 1:
             # Find feasible components
             feasible_components = []
@@ -996,42 +1056,34 @@ class TSP(Benchmark):
             elif len(candidate) == len(self.weights) - 1:
                 first = candidate[0]
                 last = candidate[-1]
-                feasible_components = [c for c in self.components if c.element[0] == last.element[1] and c.element[1] == first.element[0]]
+                feasible_components = [c for c in self._components_from[last.element[1]] if c.element[1] == first.element[0]]
             else:
                 last = candidate[-1]
-                already_visited = [c.element[0] for c in candidate]
-                already_visited.extend([c.element[1] for c in candidate])
-                already_visited = set(already_visited)
-                feasible_components = [c for c in self.components if c.element[0] == last.element[1] and c.element[1] not in already_visited]
+                feasible_components = [c for c in self._components_from[last.element[1]] if not visited[c.element[1]]]
             if len(feasible_components) == 0:
                 candidate = []
+                visited = [False] * len(self.weights)
             else:
-                # Choose a feasible component
-                if random.random() <= self.bias:
-                    next_component = max(feasible_components)
-                else:
-                    next_component = selectors.fitness_proportionate_selection(random, feasible_components, {'num_selected': 1})[0]
+                next_component = _choose_component(random, feasible_components, self.bias)
                 candidate.append(next_component)
+                visited[next_component.element[0]] = True
+                visited[next_component.element[1]] = True
         return candidate
 
     def evaluator(self, candidates, args):
         """Return the fitness values for the given candidates."""
-        fitness = []
+        if len(candidates) == 0:
+            return []
+        # The length of every tour is found at once by gathering its edge
+        # weights out of the distance matrix.
         if self._use_ants:
-            for candidate in candidates:
-                total = 0
-                for c in candidate:
-                    total += self.weights[c.element[0]][c.element[1]]
-                last = (candidate[-1].element[1], candidate[0].element[0])
-                total += self.weights[last[0]][last[1]]
-                fitness.append(1 / total)
+            edges = numpy.array([[c.element for c in candidate] for candidate in candidates], dtype=numpy.intp)
+            src, dst = edges[:, :, 0], edges[:, :, 1]
+            totals = self._weight_matrix[src, dst].sum(axis=1) + self._weight_matrix[dst[:, -1], src[:, 0]]
         else:
-            for candidate in candidates:
-                total = 0
-                for src, dst in zip(candidate, candidate[1:] + [candidate[0]]):
-                    total += self.weights[src][dst]
-                fitness.append(1 / total)
-        return fitness
+            tours = numpy.asarray(candidates, dtype=numpy.intp)
+            totals = self._weight_matrix[tours, numpy.roll(tours, -1, axis=1)].sum(axis=1)
+        return (1 / totals).tolist()
 
 class Knapsack(Benchmark):
     """Defines the Knapsack benchmark problem.
@@ -1072,12 +1124,14 @@ class Knapsack(Benchmark):
         Benchmark.__init__(self, len(items))
         self.capacity = capacity
         self.items = items
+        self._item_weights = numpy.array([item[0] for item in items])
+        self._item_values = numpy.array([item[1] for item in items])
         self.components = [swarm.TrailComponent((item[0]), value=item[1]) for item in items]
         self.duplicates = duplicates
         self.bias = 0.5
         if self.duplicates:
             max_count = [self.capacity // item[0] for item in self.items]
-            self.bounder = ec.DiscreteBounder([i for i in range(max(max_count)+1)])
+            self.bounder = ec.DiscreteBounder(list(range(max(max_count)+1)))
         else:
             self.bounder = ec.DiscreteBounder([0, 1])
         self.maximize = True
@@ -1089,32 +1143,34 @@ class Knapsack(Benchmark):
             max_count = [self.capacity // item[0] for item in self.items]
             return [random.randint(0, m) for m in max_count]
         else:
-            return [random.choice([0, 1]) for _ in range(len(self.items))]
+            # Every inclusion bit of a 0/1 candidate is drawn in one call.
+            return ec.utilities.numpy_random(random, args).integers(0, 2, len(self.items)).tolist()
 
     def constructor(self, random, args):
         """Return a candidate solution for an ant colony optimization."""
         self._use_ants = True
         candidate = []
+        total_weight = 0
+        # Components are identified by their weights, so once one is
+        # packed (without duplicates) every component sharing its weight
+        # is ruled out. Feasibility is then a mask over the item weights.
+        available = numpy.ones(len(self.components), dtype=bool)
         while len(candidate) < len(self.components):
             # Find feasible components
-            feasible_components = []
             if len(candidate) == 0:
-                feasible_components = self.components
+                feasible = available
             else:
-                remaining_capacity = self.capacity - sum([c.element for c in candidate])
-                if self.duplicates:
-                    feasible_components = [c for c in self.components if c.element <= remaining_capacity]
-                else:
-                    feasible_components = [c for c in self.components if c not in candidate and c.element <= remaining_capacity]
+                feasible = available & (self._item_weights <= self.capacity - total_weight)
+            feasible_components = [self.components[i] for i in numpy.flatnonzero(feasible)]
             if len(feasible_components) == 0:
                 break
             else:
                 # Choose a feasible component
-                if random.random() <= self.bias:
-                    next_component = max(feasible_components)
-                else:
-                    next_component = selectors.fitness_proportionate_selection(random, feasible_components, {'num_selected': 1})[0]
+                next_component = _choose_component(random, feasible_components, self.bias)
                 candidate.append(next_component)
+                total_weight += next_component.element
+                if not self.duplicates:
+                    available &= self._item_weights != next_component.element
         return candidate
 
     def evaluator(self, candidates, args):
@@ -1126,17 +1182,13 @@ class Knapsack(Benchmark):
                 for c in candidate:
                     total += c.value
                 fitness.append(total)
-        else:
-            for candidate in candidates:
-                total_value = 0
-                total_weight = 0
-                for c, i in zip(candidate, self.items):
-                    total_weight += c * i[0]
-                    total_value += c * i[1]
-                if total_weight > self.capacity:
-                    fitness.append(self.capacity - total_weight)
-                else:
-                    fitness.append(total_value)
+        elif len(candidates) > 0:
+            # The candidates hold how many of each item are packed, so the
+            # totals for the whole population are two matrix products.
+            counts = numpy.asarray(candidates)
+            total_weight = counts @ self._item_weights
+            total_value = counts @ self._item_values
+            fitness = numpy.where(total_weight > self.capacity, self.capacity - total_weight, total_value).tolist()
         return fitness
 
 
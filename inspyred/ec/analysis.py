@@ -28,8 +28,8 @@
     .. module:: analysis
     .. moduleauthor:: Aaron Garrett <garrett@inspiredintelligence.io>
 """
-import csv
 import math
+import numpy
 
 def fitness_statistics(population):
     """Return the basic statistics of the population's fitness values.
@@ -48,42 +48,34 @@ def fitness_statistics(population):
     
     .. note::
     
-       This function makes use of the numpy library for calculations. If that
-       library is not found, it attempts to complete the calculations 
-       internally. However, this second attempt will fail for multiobjective
-       fitness values and will return ``nan`` for the mean, median, and 
-       standard deviation.
+       This function makes use of the numpy library for calculations. For
+       multiobjective fitness values, the mean, median, and standard 
+       deviation are taken over all of the objective values together. If 
+       the fitness values cannot be converted to numbers, ``nan`` is 
+       returned for the mean, median, and standard deviation.
     
     Arguments:
     
     - *population* -- the population of individuals 
 
     """
-    population.sort(reverse=True)
-    worst_fit = population[-1].fitness
-    best_fit = population[0].fitness
+    # The best and worst are found in a single pass each rather than by
+    # sorting, and the remaining statistics come from one float array.
+    worst_fit = min(population).fitness
+    best_fit = max(population).fitness
+    f = [p.fitness for p in population]
     try:
-        import numpy
-        f = [p.fitness for p in population]
-        med_fit = numpy.median(f)
-        avg_fit = numpy.mean(f)
-        std_fit = numpy.std(f)
-    except ImportError:
         try:
-            plen = len(population)
-            if plen % 2 == 1:
-                med_fit = population[(plen - 1) // 2].fitness
-            else:
-                med_fit = float(population[plen // 2 - 1].fitness + population[plen // 2].fitness) / 2
-            avg_fit = sum([p.fitness for p in population]) / float(plen)
-            if plen > 1:
-                std_fit = math.sqrt(sum([(p.fitness - avg_fit)**2 for p in population]) / float(plen - 1))
-            else:
-                std_fit = 0
-        except TypeError:
-            med_fit = float('nan')
-            avg_fit = float('nan')
-            std_fit = float('nan')
+            fit = numpy.fromiter(f, dtype=numpy.float64, count=len(f))
+        except (TypeError, ValueError):
+            fit = numpy.asarray(f, dtype=numpy.float64)
+        med_fit = numpy.median(fit)
+        avg_fit = fit.mean()
+        std_fit = fit.std()
+    except (TypeError, ValueError):
+        med_fit = float('nan')
+        avg_fit = float('nan')
+        std_fit = float('nan')
     return {'best': best_fit, 'worst': worst_fit, 'mean': avg_fit, 
             'median': med_fit, 'std': std_fit}
             
@@ -116,23 +108,9 @@ def generation_plot(file, errorbars=True):
     import matplotlib.pyplot as plt
     import matplotlib.font_manager 
     
-    generation = []
-    psize = []
-    worst = []
-    best = []
-    median = []
-    average = []
-    stdev = []
-    reader = csv.reader(file)
-    for row in reader:
-        generation.append(int(row[0]))
-        psize.append(int(row[1]))
-        worst.append(float(row[2]))
-        best.append(float(row[3]))
-        median.append(float(row[4]))
-        average.append(float(row[5]))
-        stdev.append(float(row[6]))
-    stderr = [s / math.sqrt(p) for s, p in zip(stdev, psize)]
+    columns = numpy.loadtxt(file, delimiter=',', usecols=range(7), ndmin=2, unpack=True)
+    generation, psize, worst, best, median, average, stdev = columns
+    stderr = stdev / numpy.sqrt(psize)
     
     data = [average, median, best, worst]
     colors = ['black', 'blue', 'green', 'red']
@@ -146,8 +124,8 @@ def generation_plot(file, errorbars=True):
         plt.plot(generation, d, color=col, label=lab)
     plt.fill_between(generation, data[2], data[3], color='#e6f2e6')
     plt.grid(True)
-    ymin = min([min(d) for d in data])
-    ymax = max([max(d) for d in data])
+    ymin = min([d.min() for d in data])
+    ymax = max([d.max() for d in data])
     yrange = ymax - ymin
     plt.ylim((ymin - 0.1*yrange, ymax + 0.1*yrange))  
     prop = matplotlib.font_manager.FontProperties(size=8) 
@@ -195,67 +173,48 @@ def allele_plot(file, normalize=False, alleles=None, generations=None):
     """    
     import matplotlib.pyplot as plt
     
-    generation_data = []
-    reader = csv.reader(open(file))
-    for row in reader:
-        g = int(row[0])
-        row[3] = row[3].replace('[', '')
-        row[-1] = row[-1].replace(']', '')
-        individual = [float(r) for r in row[3:]]
-        individual.append(float(row[2]))
-        try:
-            generation_data[g]
-        except IndexError:
-            generation_data.append([])
-        generation_data[g].append(individual)
-    for gen in generation_data:
-        gen.sort(key=lambda x: x[-1])
-        for j, g in enumerate(gen):
-            gen[j] = g[:-1]
-        
-    best = []
-    median = []
-    average = []
-    for gen in generation_data:
-        best.append(gen[0])
-        plen = len(gen)
-        if plen % 2 == 1:
-            med = gen[(plen - 1) // 2]
-        else:
-            med = []
-            for a, b in zip(gen[plen // 2 - 1], gen[plen // 2]):
-                med.append(float(a + b) / 2)
-        median.append(med)
-        avg = [0] * len(gen[0])
-        for individual in gen:
-            for i, allele in enumerate(individual):
-                avg[i] += allele
-        for i, a in enumerate(avg):
-            avg[i] /= float(len(gen))
-        average.append(avg)        
+    # Each row holds the generation, individual number, fitness, and then
+    # the bracketed candidate, so once the brackets are dropped the whole
+    # file is a single table of numbers that can be split by generation.
+    with open(file) as individuals_file:
+        rows = numpy.loadtxt((line.replace('[', '').replace(']', '') for line in individuals_file), 
+                             delimiter=',', ndmin=2)
+    # One stable sort orders the rows by generation and, within each
+    # generation, by fitness. The best, median, and average individuals 
+    # of every generation then come from the rows at each generation's 
+    # start and middle and from sums over each generation's block.
+    rows = rows[numpy.lexsort((rows[:, 2], rows[:, 0]))]
+    individuals = rows[:, 3:]
+    starts = numpy.flatnonzero(numpy.diff(rows[:, 0], prepend=numpy.nan))
+    plen = numpy.diff(numpy.append(starts, len(rows)))
+    best = individuals[starts]
+    median = (individuals[starts + (plen - 1) // 2] + individuals[starts + plen // 2]) / 2
+    average = numpy.add.reduceat(individuals, starts, axis=0) / plen[:, numpy.newaxis]
     
+    if alleles is None:
+        alleles = list(range(len(best[0])))
+    if generations is None:
+        generations = list(range(len(best)))
+    step_size = max(len(generations) // 7, 1)
+    ytick_locs = list(range(step_size, len(generations), step_size))
+    ytick_labs = generations[step_size::step_size]
     for plot_num, (data, title) in enumerate(zip([best, median, average], 
                                                  ["Best", "Median", "Average"])):
-        if alleles is None:
-            alleles = list(range(len(data[0])))
-        if generations is None:
-            generations = list(range(len(data)))    
+        data = numpy.array(data)
         if normalize:
-            columns = list(zip(*data))
-            max_col = [max(c) for c in columns]
-            min_col = [min(c) for c in columns]
-            for dat in data:
-                for i, d in enumerate(dat):
-                    dat[i] = (d - min_col[i]) / float(max_col[i] - min_col[i])
-        plot_data = []
-        for g in generations:
-            plot_data.append([data[g][a] for a in alleles])
+            # An allele that never changes is mapped to zero rather than
+            # being divided by a zero range.
+            min_col = data.min(axis=0)
+            range_col = data.max(axis=0) - min_col
+            data = (data - min_col) / numpy.where(range_col == 0, 1.0, range_col)
+        plot_data = data[numpy.ix_(generations, alleles)]
         sub = plt.subplot(3, 1, plot_num + 1)
-        plt.pcolor(plt.array(plot_data))
+        # The image is drawn as a single raster rather than a mesh of 
+        # cells, stretched so that each cell spans one unit as it would
+        # in a pcolor plot and the ticks below stay where they were.
+        plt.imshow(plot_data, aspect='auto', interpolation='nearest', origin='lower',
+                   extent=(0, len(alleles), 0, len(generations)))
         plt.colorbar()
-        step_size = max(len(generations) // 7, 1)
-        ytick_locs = list(range(step_size, len(generations), step_size))
-        ytick_labs = generations[step_size::step_size]
         plt.yticks(ytick_locs, ytick_labs)
         plt.ylabel('Generation')
         if plot_num == 2:
@@ -279,7 +238,10 @@ def hypervolume(pareto_set, reference_point=None):
     The *reference_point* may be specified or it may be left as the default 
     value of None. In that case, the reference point is calculated to be the
     maximum value in the set for all objectives (the ideal point). This function 
-    assumes that objectives are to be maximized.
+    assumes that objectives are to be maximized. For five or more objectives,
+    when every point lies above the reference point, the faster Walking Fish 
+    Group (WFG) procedure of While, et al. (IEEE TEC 2012) is used in place
+    of HSO.
     
     Arguments:
     
@@ -287,6 +249,9 @@ def hypervolume(pareto_set, reference_point=None):
     - *reference_point* -- the reference point to be used (default None)
     
     """
+    # The point lists are walked by position rather than by repeatedly
+    # slicing off their heads, which would copy the rest of the list at
+    # every step.
     def dominates(p, q, k=None):
         if k is None:
             k = len(p)
@@ -298,36 +263,57 @@ def hypervolume(pareto_set, reference_point=None):
         
     def insert(p, k, pl):
         ql = []
-        while pl and pl[0][k] > p[k]:
-            ql.append(pl[0])
-            pl = pl[1:]
+        i = 0
+        while i < len(pl) and pl[i][k] > p[k]:
+            ql.append(pl[i])
+            i += 1
         ql.append(p)
-        while pl:
-            if not dominates(p, pl[0], k):
-                ql.append(pl[0])
-            pl = pl[1:]
+        while i < len(pl):
+            if not dominates(p, pl[i], k):
+                ql.append(pl[i])
+            i += 1
         return ql
 
     def slice(pl, k, ref):
-        p = pl[0]
-        pl = pl[1:]
         ql = []
         s = []
-        while pl:
+        for p, p_prime in zip(pl, pl[1:]):
             ql = insert(p, k + 1, ql)
-            p_prime = pl[0]
             s.append((math.fabs(p[k] - p_prime[k]), ql))
-            p = p_prime
-            pl = pl[1:]
+        p = pl[-1]
         ql = insert(p, k + 1, ql)
         s.append((math.fabs(p[k] - ref[k]), ql))
         return s
 
+    # WFG sums the volume each point adds beyond the points after it, which
+    # is its own box less the (recursive) volume of those points once they
+    # are limited to the current one.
+    def nondominated(pl):
+        ql = []
+        for p in pl:
+            for q in ql:
+                if all(a >= b for a, b in zip(q, p)):
+                    break
+            else:
+                ql = [q for q in ql if not all(a >= b for a, b in zip(p, q))]
+                ql.append(p)
+        return ql
+
+    def wfg(pl, ref):
+        pl = sorted(pl, key=lambda x: x[-1], reverse=True)
+        vol = 0
+        for i, p in enumerate(pl):
+            limited = [[min(a, b) for a, b in zip(q, p)] for q in pl[i + 1:]]
+            vol = vol + math.prod([a - r for a, r in zip(p, ref)]) - wfg(nondominated(limited), ref)
+        return vol
+
     ps = pareto_set
     ref = reference_point
     n = min([len(p) for p in ps])
     if ref is None:
-        ref = [max(ps, key=lambda x: x[o])[o] for o in range(n)]
+        ref = numpy.array([p[:n] for p in ps], dtype=numpy.float64).max(axis=0).tolist()
+    if n >= 5 and all([p[k] >= ref[k] for p in ps for k in range(n)]):
+        return wfg(nondominated([p[:n] for p in ps]), ref)
     pl = ps[:]
     pl.sort(key=lambda x: x[0], reverse=True)
     s = [(1, pl)]
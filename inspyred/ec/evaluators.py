@@ -36,6 +36,7 @@
     .. moduleauthor:: Jelle Feringa <jelleferinga@gmail.com>
 """
 import functools
+import itertools
 import pickle
 
 
@@ -80,9 +81,12 @@ def parallel_evaluation_pp(candidates, args):
     This function allows parallel evaluation of candidate solutions.
     It uses the `Parallel Python <http://www.parallelpython.com>`_  (pp)
     library to accomplish the parallelization. This library must already
-    be installed in order to use this function. The function assigns the
-    evaluation of each candidate to its own job, all of which are then
-    distributed to the available processing units.
+    be installed in order to use this function. The candidates are split
+    into one contiguous block for each processing unit known to the job
+    server, and each block is evaluated as a single job. The arguments are
+    therefore pickled once per block rather than once per candidate. If a
+    block fails, its candidates are resubmitted one at a time so that only
+    the candidates that actually fail are given a fitness of None.
 
     .. note::
 
@@ -146,27 +150,55 @@ def parallel_evaluation_pp(candidates, args):
             pass
 
     func_template = pp.Template(job_server, evaluator, pp_depends, pp_modules)
-    jobs = [func_template.submit([c], pickled_args) for c in candidates]
+    n = len(candidates)
+    nblocks = max(1, min(n, job_server.get_ncpus()))
+    blocks = [candidates[i * n // nblocks:(i + 1) * n // nblocks] for i in range(nblocks)]
+    jobs = [func_template.submit(b, pickled_args) for b in blocks]
+    results = [job() for job in jobs]
+
+    # A job that fails returns None for its whole block, so the candidates
+    # of a failed block are resubmitted one at a time to find out which of
+    # them actually failed.
+    retries = {}
+    for i, (block, r) in enumerate(zip(blocks, results)):
+        if len(block) > 1 and (r is None or len(r) != len(block)):
+            retries[i] = [func_template.submit([c], pickled_args) for c in block]
 
     fitness = []
-    for i, job in enumerate(jobs):
-        r = job()
-        try:
-            fitness.append(r[0])
-        except TypeError:
-            logger.warning('parallel_evaluation_pp generated an invalid fitness for candidate {0}'.format(candidates[i]))
-            fitness.append(None)
+    for i, (block, r) in enumerate(zip(blocks, results)):
+        if i not in retries and r is not None and len(r) == len(block):
+            fitness.extend(r)
+            continue
+        singles = [job() for job in retries[i]] if i in retries else [r]
+        for c, r in zip(block, singles):
+            if r is not None and len(r) == 1:
+                fitness.append(r[0])
+            else:
+                logger.warning('parallel_evaluation_pp generated an invalid fitness for candidate {0}'.format(c))
+                fitness.append(None)
     return fitness
 
 
+_mp_worker_evaluator = None
+_mp_worker_args = None
+
+def _initialize_mp_worker(evaluator, args):
+    global _mp_worker_evaluator, _mp_worker_args
+    _mp_worker_evaluator = evaluator
+    _mp_worker_args = args
+
+def _evaluate_mp_block(candidates):
+    return _mp_worker_evaluator(candidates, _mp_worker_args)
+
 def parallel_evaluation_mp(candidates, args):
     """Evaluate the candidates in parallel using ``multiprocessing``.
 
     This function allows parallel evaluation of candidate solutions.
     It uses the standard multiprocessing library to accomplish the
-    parallelization. The function assigns the evaluation of each
-    candidate to its own job, all of which are then distributed to the
-    available processing units.
+    parallelization. The candidates are split into one contiguous block
+    for each processing unit, and each block is evaluated as a single
+    job. The arguments are sent to each worker process only once, when
+    the process is started, rather than along with every job.
 
     .. note::
 
@@ -214,11 +246,14 @@ def parallel_evaluation_mp(candidates, args):
 
     start = time.time()
     try:
-        pool = multiprocessing.Pool(processes=nprocs)
-        results = [pool.apply_async(evaluator, ([c], pickled_args)) for c in candidates]
+        pool = multiprocessing.Pool(processes=nprocs, initializer=_initialize_mp_worker, 
+                                    initargs=(evaluator, pickled_args))
+        n = len(candidates)
+        blocks = [candidates[i * n // nprocs:(i + 1) * n // nprocs] for i in range(nprocs)]
+        results = [pool.apply_async(_evaluate_mp_block, (b,)) for b in blocks if len(b) > 0]
         pool.close()
         pool.join()
-        return [r.get()[0] for r in results]
+        return list(itertools.chain.from_iterable(r.get() for r in results))
     except (OSError, RuntimeError) as e:
         logger.error('failed parallel_evaluation_mp: {0}'.format(str(e)))
         raise
@@ -42,6 +42,7 @@
     .. module:: selectors
     .. moduleauthor:: Aaron Garrett <garrett@inspiredintelligence.io>
 """
+import numpy
 
 
 def default_selection(random, population, args):
@@ -107,6 +108,16 @@ def uniform_selection(random, population, args):
     return selected
 
 
+def _spin_roulette_wheel(random, population, psum, num_selected):
+    # Select the individual at the first cumulative probability in psum 
+    # that exceeds each cutoff. All of the cutoffs are looked up with a
+    # single binary search over the whole wheel.
+    cutoffs = [random.random() for _ in range(num_selected)]
+    indices = numpy.searchsorted(psum, cutoffs, side='right')
+    indices = numpy.minimum(indices, len(population) - 1)
+    return [population[i] for i in indices.tolist()]
+
+
 def fitness_proportionate_selection(random, population, args):
     """Return fitness proportionate sampling of individuals from the population.
     
@@ -127,7 +138,7 @@ def fitness_proportionate_selection(random, population, args):
     """
     num_selected = args.setdefault('num_selected', 1)
     len_pop = len(population)
-    psum = [i for i in range(len_pop)]
+    psum = numpy.arange(len_pop)
     pop_max_fit = (max(population)).fitness
     pop_min_fit = (min(population)).fitness
     
@@ -138,30 +149,12 @@ def fitness_proportionate_selection(random, population, args):
     
     # Set up the roulette wheel
     if pop_max_fit == pop_min_fit:
-        psum = [(index + 1) / float(len_pop) for index in range(len_pop)]
+        psum = numpy.arange(1, len_pop + 1) / float(len_pop)
     elif (pop_max_fit > 0 and pop_min_fit >= 0) or (pop_max_fit <= 0 and pop_min_fit < 0):
         population.sort(reverse=True)
-        psum[0] = population[0].fitness
-        for i in range(1, len_pop):
-            psum[i] = population[i].fitness + psum[i-1]
-        for i in range(len_pop):
-            psum[i] /= float(psum[len_pop-1])
-            
-    # Select the individuals
-    selected = []
-    for _ in range(num_selected):
-        cutoff = random.random()
-        lower = 0
-        upper = len_pop - 1
-        while(upper >= lower):
-            mid = (lower + upper) // 2
-            if psum[mid] > cutoff: 
-                upper = mid - 1
-            else: 
-                lower = mid + 1
-        lower = max(0, min(len_pop-1, lower))
-        selected.append(population[lower])
-    return selected
+        psum = numpy.cumsum([p.fitness for p in population], dtype=numpy.float64)
+        psum /= psum[-1]
+    return _spin_roulette_wheel(random, population, psum, num_selected)
 
 
 def rank_selection(random, population, args):
@@ -188,28 +181,9 @@ def rank_selection(random, population, args):
     # Set up the roulette wheel
     len_pop = len(population)
     population.sort()
-    psum = list(range(len_pop))
     den = (len_pop * (len_pop + 1)) / 2.0
-    for i in range(len_pop):
-        psum[i] = (i + 1) / den
-    for i in range(1, len_pop):
-        psum[i] += psum[i-1]
-        
-    # Select the individuals
-    selected = []
-    for _ in range(num_selected):
-        cutoff = random.random()
-        lower = 0
-        upper = len_pop - 1
-        while(upper >= lower):
-            mid = (lower + upper) // 2
-            if psum[mid] > cutoff: 
-                upper = mid - 1
-            else: 
-                lower = mid + 1
-        lower = max(0, min(len_pop-1, lower))
-        selected.append(population[lower])
-    return selected
+    psum = numpy.cumsum(numpy.arange(1, len_pop + 1) / den)
+    return _spin_roulette_wheel(random, population, psum, num_selected)
 
 
 def tournament_selection(random, population, args):
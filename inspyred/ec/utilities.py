@@ -3,7 +3,7 @@
     :mod:`utilities` -- Optimization utility functions
     ==================================================
 
-    This module provides utility classes and decorators for evolutionary computations.
+    This module provides utility classes, decorators, and functions for evolutionary computations.
 
     .. Copyright 2012 Aaron Garrett
 
@@ -32,6 +32,7 @@ import functools
 import multiprocessing
 from collections import OrderedDict
 import pickle
+import numpy
 
 
 class BoundedOrderedDict(OrderedDict):
@@ -62,8 +63,10 @@ def memoize(func=None, maxlen=None):
     This decorator assumes that candidates are individually pickleable,
     and their pickled values are used for hashing into a dictionary. It
     should be used when evaluating an *expensive* fitness
-    function to avoid costly re-evaluation of those fitnesses. The
-    typical usage is as follows::
+    function to avoid costly re-evaluation of those fitnesses. Any 
+    candidates that are not found in the cache are passed to the function
+    together in a single call, so evaluators that work on a whole batch
+    of candidates at once keep doing so. The typical usage is as follows::
 
         @memoize
         def expensive_fitness_function(candidates, args):
@@ -90,13 +93,24 @@ def memoize(func=None, maxlen=None):
         cache = BoundedOrderedDict(maxlen=maxlen)
         @functools.wraps(func)
         def memo_target(candidates, args):
-            fitness = []
-            for candidate in candidates:
-                lookup_value = pickle.dumps(candidate, 1)
-                if lookup_value not in cache:
-                    cache[lookup_value] = func([candidate], args)[0]
-                fitness.append(cache[lookup_value])
-            return fitness
+            lookup_values = [pickle.dumps(candidate, 1) for candidate in candidates]
+            known = {}
+            missing = OrderedDict()
+            for lookup_value, candidate in zip(lookup_values, candidates):
+                if lookup_value in known or lookup_value in missing:
+                    continue
+                try:
+                    known[lookup_value] = cache[lookup_value]
+                except KeyError:
+                    missing[lookup_value] = candidate
+            # All of the candidates that are not cached are evaluated 
+            # together in a single call to the original function.
+            if len(missing) > 0:
+                missing_fitness = func(list(missing.values()), args)
+                for lookup_value, fit in zip(missing, missing_fitness):
+                    cache[lookup_value] = fit
+                    known[lookup_value] = fit
+            return [known[lookup_value] for lookup_value in lookup_values]
         return memo_target
     else:
         def memoize_factory(func):
@@ -178,3 +192,30 @@ class Objectify(object):
                 if key in params:
                     setattr(self, key, newargs[-1][key])
         return return_value
+
+
+def numpy_random(random, args):
+    """Return a NumPy random number generator for the evolutionary computation.
+
+    Operators that draw many numbers at once (e.g., a generator that
+    creates a whole candidate) can do so with a single call to a NumPy
+    ``Generator`` rather than one call to *random* per number. The first
+    call creates the generator, seeding it from *random* so that runs
+    remain reproducible, and stores it in *args* under the key
+    ``_numpy_random``. Later calls return the stored generator. The
+    typical usage is as follows::
+
+        def my_generator(random, args):
+            size = args.get('num_inputs', 10)
+            return numpy_random(random, args).uniform(-1, 1, size).tolist()
+
+    .. Arguments:
+       random -- the random number generator object
+       args -- a dictionary of keyword arguments
+
+    """
+    try:
+        return args['_numpy_random']
+    except KeyError:
+        args['_numpy_random'] = numpy.random.default_rng(random.getrandbits(64))
+        return args['_numpy_random']
@@ -47,6 +47,7 @@
     .. module:: topologies
     .. moduleauthor:: Aaron Garrett <garrett@inspiredintelligence.io>
 """
+import numpy
 
 
 def star_topology(random, population, args):
@@ -99,4 +100,39 @@ def ring_topology(random, population, args):
         for i in range(0, neighborhood_size):
             n.append(population[(start + i) % len(population)])
         yield n
+
+
+def numpy_ring_topology(random, population, args):
+    """Returns the best neighbor using a ring topology.
+    
+    This function uses the same neighborhoods as ``ring_topology``, but
+    instead of the full list of neighbors, it returns a list containing
+    only the best particle in each neighborhood. All of the neighborhoods
+    are searched at once with a ``numpy`` reduction, which is much faster
+    for large swarms. Since the PSO only makes use of the best neighbor,
+    the resulting swarm behaves exactly as it would with ``ring_topology``.
+    This topology requires single-objective (numeric) fitness values.
     
+    .. Arguments:
+       random -- the random number generator object
+       population -- the population of particles
+       args -- a dictionary of keyword arguments
+
+    Optional keyword arguments in args:
+    
+    - *neighborhood_size* -- the width of the neighborhood around a 
+      particle which determines the size of the neighborhood
+      (default 3)
+    
+    """
+    neighborhood_size = args.setdefault('neighborhood_size', 3)
+    half_hood = neighborhood_size // 2
+    num_particles = len(population)
+    # Negate the fitness values when minimizing so that the best neighbor
+    # is always the first largest value in its neighborhood.
+    fitness = numpy.array([p.fitness if p.maximize else -p.fitness for p in population], dtype=numpy.float64)
+    offsets = numpy.arange(-half_hood, neighborhood_size - half_hood)
+    hoods = (numpy.arange(num_particles)[:, numpy.newaxis] + offsets) % num_particles
+    best = hoods[numpy.arange(num_particles), fitness[hoods].argmax(axis=1)]
+    for b in best.tolist():
+        yield [population[b]]
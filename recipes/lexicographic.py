@@ -1,4 +1,5 @@
 import functools
+import numpy
 
 @functools.total_ordering
 class Lexicographic(object):
@@ -11,6 +12,9 @@ class Lexicographic(object):
         except TypeError:
             maximize = [maximize for v in values]
         self.maximize = maximize
+        # Negating the minimized objectives lets a single tuple
+        # comparison stand in for the objective-by-objective loop.
+        self._key = tuple(v if m else -v for v, m in zip(values, maximize))
 
     def __len__(self):
         return len(self.values)
@@ -22,18 +26,7 @@ class Lexicographic(object):
         return iter(self.values)
         
     def __lt__(self, other):
-        for v, o, m in zip(self.values, other.values, self.maximize):
-            if m:
-                if v < o:
-                    return True
-                elif v > o:
-                    return False
-            else:
-                if v > o:
-                    return True
-                elif v < o:
-                    return False
-        return False
+        return self._key < other._key
 
     def __eq__(self, other):
         return (self.values == other.values and self.maximize == other.maximize)
@@ -45,6 +38,27 @@ class Lexicographic(object):
         return str(self.values)
 
 
+def lex_sort(population, reverse=False):
+    """Return the individuals sorted (worst first) by their Lexicographic fitness.
+
+    Rather than calling ``__lt__`` for every comparison, the signed keys of
+    the whole population are stacked into an array and ordered with a single
+    ``numpy.lexsort``. All individuals are assumed to share the same
+    ``maximize`` setting.
+
+    """
+    if not population:
+        return []
+    keys = numpy.array([p.fitness._key for p in population], dtype=numpy.float64)
+    if population[0].maximize == reverse:
+        keys = -keys
+    # lexsort treats its last key as the primary one. It is stable, so
+    # negating the keys rather than reversing the order keeps ties in
+    # population order, as sorted() does.
+    order = numpy.lexsort(keys.T[::-1])
+    return [population[i] for i in order]
+
+
 def my_evaluator(candidates, args):
     fitness = []
     for candidate in candidates:
@@ -49,6 +49,11 @@ class EvaluatorTests(unittest.TestCase):
     def test_parallel_evaluation_mp(self):
         fitnesses = inspyred.ec.evaluators.parallel_evaluation_mp(self.candidates, {'_ec':self.ec, 'mp_evaluator':self.evaluator})
         assert fitnesses == self.fitnesses
+
+    def test_parallel_evaluation_mp_benchmark(self):
+        problem = inspyred.benchmarks.Rastrigin(6)
+        fitnesses = inspyred.ec.evaluators.parallel_evaluation_mp(self.candidates, {'_ec':self.ec, 'mp_evaluator':problem.evaluator, 'mp_nprocs':3})
+        assert fitnesses == problem.evaluator(self.candidates, {})
         
 if __name__ == '__main__':
     unittest.main()
@@ -1,13 +1,172 @@
 import inspyred
+import math
 import multiprocessing
+import numpy
+import os
 import random
+import sys
 import unittest
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'recipes'))
+
+import lexicographic
 
 
 class AnalysisTests(unittest.TestCase):
-    def test_hypervolume(self):
-        assert True
+    def test_fitness_statistics(self):
+        population = [inspyred.ec.Individual([i], maximize=False) for i in range(4)]
+        for p, f in zip(population, [3, 1, 4, 2]):
+            p.fitness = f
+        stats = inspyred.ec.analysis.fitness_statistics(population)
+        assert stats['best'] == 1 and stats['worst'] == 4
+        assert stats['median'] == 2.5 and stats['mean'] == 2.5
+        assert abs(stats['std'] - math.sqrt(1.25)) < 1e-12
+        assert [p.fitness for p in population] == [3, 1, 4, 2]
         
+    def test_hypervolume(self):
+        assert inspyred.ec.analysis.hypervolume([[1, 2], [2, 1]], [0, 0]) == 3
+        assert inspyred.ec.analysis.hypervolume([[1, 1, 1]], [0, 0, 0]) == 1
+        front = [[1, 2, 1], [2, 1, 1], [1, 1, 2]]
+        assert inspyred.ec.analysis.hypervolume(front, [0, 0, 0]) == 4
+        assert inspyred.ec.analysis.hypervolume([[1, 2], [2, 1]]) == 1
+        front = [[2, 1, 1, 1, 1], [1, 2, 1, 1, 1], [1, 1, 1, 1, 1], [1, 2, 1, 1, 1]]
+        assert inspyred.ec.analysis.hypervolume(front, [0, 0, 0, 0, 0]) == 3
+
+
+class BenchmarkTests(unittest.TestCase):
+    def test_ackley(self):
+        problem = inspyred.benchmarks.Ackley(3)
+        c = [0.5, -1.25, 3]
+        expected = (-20 * math.exp(-0.2 * math.sqrt(sum([x**2 for x in c]) / 3)) -
+                    math.exp(sum([math.cos(2 * math.pi * x) for x in c]) / 3) + 20 + math.e)
+        fit = problem.evaluator([[0, 0, 0], c], {})
+        assert abs(fit[0]) < 1e-12
+        assert abs(fit[1] - expected) < 1e-12
+        assert problem(*c) == fit[1]
+
+    def test_benchmark_dtype(self):
+        problem = inspyred.benchmarks.Griewank(4)
+        c = [[100.0, -2.5, 30.0, 0.5], [1.0, 2.0, 3.0, 4.0]]
+        fit = problem.evaluator(c, {})
+        fit32 = problem.evaluator(c, {'benchmark_dtype': numpy.float32})
+        assert fit32 != fit
+        assert all([abs(a - b) < 1e-5 * (1 + abs(a)) for a, b in zip(fit, fit32)])
+
+    def test_binary(self):
+        problem = inspyred.benchmarks.Binary(inspyred.benchmarks.Sphere(2), dimension_bits=3)
+        candidates = [[0, 0, 0, 1, 1, 1], [1, 0, 0, 0, 1, 1], [1, 1, 1, 1, 1, 1]]
+        real = [problem._binary_to_real(c) for c in candidates]
+        assert problem._binary_to_real_batch(candidates).tolist() == real
+        assert problem.evaluator(candidates, {}) == problem.benchmark.evaluator(real, {})
+        assert problem.evaluator([], {}) == []
+
+    def test_dtlz1(self):
+        problem = inspyred.benchmarks.DTLZ1(4, 3)
+        fit = problem.evaluator([[0.5, 0.5, 0.5, 0.5], [0.2, 0.4, 0.5, 0.5]], {})
+        assert fit[0].values == [0.125, 0.125, 0.25]
+        assert fit[1].values == [0.5 * 0.2 * 0.4, 0.5 * 0.2 * 0.6, 0.5 * 0.8]
+        assert problem.evaluator([], {}) == []
+
+    def test_dtlz2(self):
+        problem = inspyred.benchmarks.DTLZ2(4, 3)
+        fit = problem.evaluator([[0, 1, 0.5, 0.5], [1, 0.5, 0.5, 1.5]], {})
+        assert all([abs(a - b) < 1e-12 for a, b in zip(fit[0].values, [0, 1, 0])])
+        assert all([abs(a - b) < 1e-12 for a, b in zip(fit[1].values, [0, 0, 2])])
+        assert problem.evaluator([], {}) == []
+
+    def test_dtlz5(self):
+        problem = inspyred.benchmarks.DTLZ5(3, 2)
+        fit = problem.evaluator([[1.0 / 3.0, 0.5, 0.5]], {})
+        assert all([abs(a - b) < 1e-12 for a, b in zip(fit[0].values, [math.sqrt(3) / 2, 0.5])])
+
+    def test_dtlz7(self):
+        problem = inspyred.benchmarks.DTLZ7(3, 2)
+        fit = problem.evaluator([[0.5, 0, 0], [0, 1, 1]], {})
+        assert all([abs(a - b) < 1e-12 for a, b in zip(fit[0].values, [0.5, 4])])
+        assert fit[1].values == [0, 22]
+        assert problem.evaluator([], {}) == []
+
+    def test_griewank(self):
+        problem = inspyred.benchmarks.Griewank(3)
+        c = [100.0, -2.5, 30.0]
+        expected = (sum([x**2 for x in c]) / 4000.0 -
+                    math.cos(c[0]) * math.cos(c[1] / math.sqrt(2)) * math.cos(c[2] / math.sqrt(3)) + 1)
+        fit = problem.evaluator([[0, 0, 0], c], {})
+        assert fit[0] == 0
+        assert abs(fit[1] - expected) < 1e-12
+        assert problem.evaluator([], {}) == []
+
+    def test_knapsack(self):
+        problem = inspyred.benchmarks.Knapsack(10, [(4, 5), (3, 4), (5, 7)])
+        fit = problem.evaluator([[1, 1, 0], [1, 0, 1], [1, 1, 1], [0, 0, 0]], {})
+        assert fit == [9, 12, -2, 0]
+        assert problem.evaluator([], {}) == []
+        c = problem.generator(random.Random(1), {})
+        assert len(c) == 3 and all([x in (0, 1) for x in c])
+
+    def test_kursawe(self):
+        problem = inspyred.benchmarks.Kursawe(3)
+        c = [1.0, -2.0, 0.5]
+        f1 = sum([-10 * math.exp(-0.2 * math.sqrt(c[i]**2 + c[i+1]**2)) for i in range(2)])
+        f2 = sum([abs(x)**0.8 + 5 * math.sin(x**3) for x in c])
+        fit = problem.evaluator([c], {})
+        assert all([abs(a - b) < 1e-12 for a, b in zip(fit[0].values, [f1, f2])])
+        assert problem.evaluator([], {}) == []
+
+    def test_ndarray_evaluator(self):
+        x = numpy.array([[0.5, 0.5, 0.5, 0.5], [1.0, 0.25, 0.0, 0.75]])
+        for problem in [inspyred.benchmarks.Sphere(4), inspyred.benchmarks.DTLZ2(4, 3)]:
+            fit = problem.ndarray_evaluator(x, {})
+            assert fit.shape == ((2,) if problem.objectives == 1 else (2, 3))
+            expected = problem.evaluator(x.tolist(), {})
+            assert [getattr(f, 'values', f) for f in expected] == fit.tolist()
+
+    def test_ragged_candidates(self):
+        assert inspyred.benchmarks.Rastrigin(3).evaluator([[1, 2, 3], [1, 2]], {}) == [14.0, 5.0]
+        c = [100.0, -2.5, 30.0, 4.0]
+        expected = (sum([x**2 for x in c]) / 4000.0 -
+                    math.cos(c[0]) * math.cos(c[1] / math.sqrt(2)) * math.cos(c[2] / math.sqrt(3)) * math.cos(c[3] / 2) + 1)
+        fit = inspyred.benchmarks.Griewank(3).evaluator([c, c[:2]], {})
+        assert abs(fit[0] - expected) < 1e-12
+        fit = inspyred.benchmarks.DTLZ7(3, 2).evaluator([[0, 1, 1, 1], [0, 1]], {})
+        assert fit[0].values == [0, 22]
+        assert fit[1].values == [0, 22]
+
+    def test_rastrigin(self):
+        problem = inspyred.benchmarks.Rastrigin(2)
+        fit = problem.evaluator([[0, 0], [1, 1], [0.5, -0.5]], {})
+        assert fit == [0, 2, 40.5]
+        assert problem.evaluator([], {}) == []
+        assert inspyred.benchmarks.Rastrigin(3).evaluator([[1, 2], [0, 0]], {}) == [5, 0]
+
+    def test_rosenbrock(self):
+        problem = inspyred.benchmarks.Rosenbrock(3)
+        fit = problem.evaluator([[1, 1, 1], [0, 0, 0], [2, 1, -1]], {})
+        assert fit == [0, 2, 1 + 900 + 400]
+        assert problem.evaluator([], {}) == []
+
+    def test_schwefel(self):
+        problem = inspyred.benchmarks.Schwefel(2)
+        c = [420.9687, -100.5]
+        expected = 418.9829 * 2 - sum([x * math.sin(math.sqrt(abs(x))) for x in c])
+        fit = problem.evaluator([c], {})
+        assert abs(fit[0] - expected) < 1e-9
+        assert problem.evaluator([], {}) == []
+
+    def test_sphere(self):
+        problem = inspyred.benchmarks.Sphere(3)
+        fit = problem.evaluator([[0, 0, 0], [1, 2, 3], [-0.5, 0.5, 0]], {})
+        assert fit == [0, 14, 0.5]
+        assert problem(1, 1, 1) == 3
+        assert problem.evaluator([[1, 2], [1, 2, 3, 4]], {}) == [5, 30]
+
+    def test_tsp(self):
+        weights = [[0, 1, 2, 1], [1, 0, 1, 2], [2, 1, 0, 1], [1, 2, 1, 0]]
+        problem = inspyred.benchmarks.TSP(weights)
+        assert problem.evaluator([[0, 1, 2, 3], [0, 2, 1, 3]], {}) == [1 / 4.0, 1 / 6.0]
+        problem._use_ants = True
+        tour = [c for c in problem.components if c.element in [(0, 1), (1, 2), (2, 3)]]
+        assert problem.evaluator([tour], {}) == [1 / 4.0]
+
 
 class BounderTests(unittest.TestCase):
     def test_bounder(self):
@@ -95,6 +254,25 @@ class UtilityTests(unittest.TestCase):
         assert all(tests_f)
         assert all(tests_g)
 
+    def test_memoize_batch(self):
+        calls = []
+        @inspyred.ec.utilities.memoize(maxlen=3)
+        def h(candidates, args):
+            calls.append(candidates)
+            return [sum(c) for c in candidates]
+        a = h([[1, 2], [3, 4], [1, 2]], {})
+        b = h([[3, 4], [5, 6], [7, 8], [5, 6]], {})
+        assert a == [3, 7, 3]
+        assert b == [7, 11, 15, 11]
+        assert calls == [[[1, 2], [3, 4]], [[5, 6], [7, 8]]]
+
+    def test_numpy_random(self):
+        args = {}
+        rng = inspyred.ec.utilities.numpy_random(random.Random(1), args)
+        assert inspyred.ec.utilities.numpy_random(random.Random(2), args) is rng
+        first = rng.random(5).tolist()
+        assert inspyred.ec.utilities.numpy_random(random.Random(1), {}).random(5).tolist() == first
+
     def test_objectify(self):
         def my_fun(x, y, args):
             z = x + y + args['key']
@@ -116,5 +294,42 @@ class UtilityTests(unittest.TestCase):
         assert d['key'] == 2
 
 
+class TopologyTests(unittest.TestCase):
+    def setUp(self):
+        self.prng = random.Random()
+        self.prng.seed(11111)
+
+    def test_numpy_ring_topology(self):
+        for maximize in [True, False]:
+            population = []
+            for i in range(10):
+                p = inspyred.ec.Individual([i], maximize=maximize)
+                p.fitness = self.prng.choice([1, 2, 3])
+                population.append(p)
+            args = {'neighborhood_size': 5}
+            ring = inspyred.swarm.topologies.ring_topology(self.prng, population, args)
+            numpy_ring = inspyred.swarm.topologies.numpy_ring_topology(self.prng, population, args)
+            for hood, best in zip(ring, numpy_ring):
+                assert best == [max(hood)]
+
+
+class RecipeTests(unittest.TestCase):
+    def setUp(self):
+        self.prng = random.Random()
+        self.prng.seed(22222)
+
+    def test_lex_sort(self):
+        for maximize in [True, False]:
+            population = []
+            for i in range(30):
+                p = inspyred.ec.Individual([i], maximize=maximize)
+                p.fitness = lexicographic.Lexicographic([self.prng.choice([1, 2]), self.prng.choice([1, 2])],
+                                                        maximize=[True, False])
+                population.append(p)
+            for reverse in [False, True]:
+                expected = sorted(population, reverse=reverse)
+                assert [p.candidate for p in lexicographic.lex_sort(population, reverse)] == [p.candidate for p in expected]
+
+
 if __name__ == '__main__':
     unittest.main()